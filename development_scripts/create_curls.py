@@ -1,21 +1,78 @@
-import html
 import json
 import os
 import re
-import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 DOMINO_URL = os.environ.get("DOMINO_URL", "https://se-demo.domino.tech:443")
 API_KEY = os.environ.get("DOMINO_USER_API_KEY", "")
 PROJECT_ID = os.environ.get("DOMINO_PROJECT_ID", "")
 
+# Each model costs an overview page fetch and an MLflow lookup
+MODEL_WORKERS = 8
+
+# -d followed by a single-quoted string containing JSON (may have nested double quotes)
+CURL_DATA_RE = re.compile(r"-d\s+'[^']*'")
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session():
+    """Return the shared keep-alive session, importing requests on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            # One connection pool for the Domino and MLflow calls; dropped connections are retried
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=20,
+                max_retries=Retry(total=3, backoff_factor=0.3),
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+    return _session
+
+
+def _loads(raw: bytes | str):
+    """Parse JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity or big integers, which only the stdlib parser accepts
+    return json.loads(raw)
+
+
+def _dumps(payload) -> str:
+    """Serialize a payload compactly, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload).decode()
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
 
 def get_models(project_id: str) -> list:
     """Get all models for a project."""
     url = f"{DOMINO_URL}/v4/modelManager/getModels"
     headers = {"X-Domino-Api-Key": API_KEY}
-    resp = requests.get(url, params={"projectId": project_id}, headers=headers, timeout=30)
+    resp = _get_session().get(url, params={"projectId": project_id}, headers=headers, timeout=30)
     resp.raise_for_status()
-    return resp.json()
+    return _loads(resp.content)
 
 
 def get_model_signature(model_name: str, model_version: int) -> dict | None:
@@ -26,11 +83,11 @@ def get_model_signature(model_name: str, model_version: int) -> dict | None:
 
     # Get the model version info to find the artifact source
     url = f"{tracking_uri.rstrip('/')}/api/2.0/mlflow/model-versions/get"
-    resp = requests.get(url, params={"name": model_name, "version": model_version}, timeout=15)
+    resp = _get_session().get(url, params={"name": model_name, "version": model_version}, timeout=15)
     if resp.status_code != 200:
         return None
 
-    source = resp.json().get("model_version", {}).get("source")
+    source = _loads(resp.content).get("model_version", {}).get("source")
     if not source:
         return None
 
@@ -43,8 +100,8 @@ def get_model_signature(model_name: str, model_version: int) -> dict | None:
         for fname in ("serving_input_example.json", "input_example.json"):
             path = os.path.join(local_dir, fname)
             if os.path.exists(path):
-                with open(path) as f:
-                    example = json.load(f)
+                with open(path, "rb") as f:
+                    example = _loads(f.read())
                 # Convert dataframe_split format to simple dict
                 if "dataframe_split" in example:
                     cols = example["dataframe_split"]["columns"]
@@ -58,34 +115,99 @@ def get_model_signature(model_name: str, model_version: int) -> dict | None:
     return None
 
 
+class _CurlTabParser(HTMLParser):
+    """Collect the text of the first <pre> inside the curl tab of a model overview page."""
+
+    def __init__(self):
+        super().__init__()
+        self.done = False
+        self._in_tab = False
+        self._in_pre = False
+        self._parts: list[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "div" and dict(attrs).get("id") == "language-curl":
+            self._in_tab = True
+        elif tag == "pre" and self._in_tab and not self.done:
+            self._in_pre = True
+
+    def handle_endtag(self, tag):
+        if tag == "pre" and self._in_pre:
+            self._in_pre = False
+            self.done = True
+
+    def handle_data(self, data):
+        if self._in_pre:
+            self._parts.append(data)
+
+    @property
+    def curl(self) -> str | None:
+        return "".join(self._parts).strip() if self.done else None
+
+
 def get_curl_from_html(model_id: str) -> str | None:
     """Fetch the model overview page and extract the curl command."""
     url = f"{DOMINO_URL}/models/{model_id}/overview"
     headers = {"X-Domino-Api-Key": API_KEY}
-    resp = requests.get(url, headers=headers, timeout=15)
-    if resp.status_code != 200:
-        return None
+    with _get_session().get(url, headers=headers, timeout=15, stream=True) as resp:
+        if resp.status_code != 200:
+            return None
+        resp.encoding = resp.encoding or "utf-8"
 
-    # Extract curl from the HTML
-    match = re.search(
-        r'<div role="tabpanel" class="tab-pane" id="language-curl">.*?<pre[^>]*>(.*?)</pre>',
-        resp.text,
-        flags=re.S | re.I,
-    )
-    if not match:
-        return None
+        # Parse the page as it arrives and stop parsing once the curl <pre> closes. The
+        # rest is still read to EOF so the keep-alive connection goes back to the pool.
+        parser = _CurlTabParser()
+        for chunk in resp.iter_content(chunk_size=16384, decode_unicode=True):
+            if not parser.done:
+                parser.feed(chunk)
 
-    return html.unescape(match.group(1)).strip()
+    return parser.curl
 
 
 def replace_curl_data(curl_text: str, payload: dict) -> str:
     """Replace the -d data in a curl command with the given payload."""
-    payload_json = json.dumps(payload)
-    # Match -d followed by single-quoted string containing JSON (may have nested double quotes)
-    # Use non-greedy match from opening quote to the closing quote before whitespace/newline or end
-    pattern = r"-d\s+'[^']*'"
-    replacement = f"-d '{payload_json}'"
-    return re.sub(pattern, replacement, curl_text)
+    match = CURL_DATA_RE.search(curl_text)
+    if not match:
+        return curl_text
+    # Spliced in directly: re.sub would treat backslash escapes in the JSON as a template
+    payload_json = _dumps(payload)
+    return f"{curl_text[:match.start()]}-d '{payload_json}'{curl_text[match.end():]}"
+
+
+def process_model(model: dict) -> str | None:
+    """Fetch one model's curl and signature and return the text to print for it."""
+    model_id = model.get("id")
+    name = model.get("name")
+    active = model.get("activeVersion") or {}
+    registered_name = active.get("registeredModelName")
+    registered_version = active.get("registeredModelVersion")
+
+    if not model_id:
+        return None
+
+    lines = [f"=== {name} ==="]
+
+    # Get the curl from the overview page
+    curl = get_curl_from_html(model_id)
+    if not curl:
+        lines.append(f"  (no curl found in overview page)")
+        return "\n".join(lines)
+
+    # Try to get the signature
+    signature = None
+    if registered_name and registered_version:
+        signature = get_model_signature(registered_name, registered_version)
+
+    if signature:
+        # Replace the -d data with the actual signature
+        curl = replace_curl_data(curl, signature)
+        lines.append(curl)
+    else:
+        lines.append(curl)
+        lines.append(f"  (no signature found for {registered_name}:{registered_version})")
+
+    lines.append("")
+    return "\n".join(lines)
 
 
 def main():
@@ -95,38 +217,11 @@ def main():
 
     models = get_models(PROJECT_ID)
 
-    for model in models:
-        model_id = model.get("id")
-        name = model.get("name")
-        active = model.get("activeVersion") or {}
-        registered_name = active.get("registeredModelName")
-        registered_version = active.get("registeredModelVersion")
-
-        if not model_id:
-            continue
-
-        print(f"=== {name} ===")
-
-        # Get the curl from the overview page
-        curl = get_curl_from_html(model_id)
-        if not curl:
-            print(f"  (no curl found in overview page)")
-            continue
-
-        # Try to get the signature
-        signature = None
-        if registered_name and registered_version:
-            signature = get_model_signature(registered_name, registered_version)
-
-        if signature:
-            # Replace the -d data with the actual signature
-            curl = replace_curl_data(curl, signature)
-            print(curl)
-        else:
-            print(curl)
-            print(f"  (no signature found for {registered_name}:{registered_version})")
-
-        print()
+    # Models are fetched concurrently; output is printed in the original model order
+    with ThreadPoolExecutor(max_workers=MODEL_WORKERS) as executor:
+        for output in executor.map(process_model, models):
+            if output is not None:
+                print(output)
 
 
 if __name__ == "__main__":
@@ -102,18 +102,28 @@ def generate_udf_method(endpoint: EndpointConfig) -> str:
         for i in range(len(endpoint.parameters))
     ])
 
-    # Build JSON payload construction
+    # Build JSON payload construction; the C# compiler folds the + chain into one string.Concat
     json_parts = ", ".join([
-        f'\\"{p["name"]}\\": " + {p["name"]}.ToString(System.Globalization.CultureInfo.InvariantCulture) + "'
+        f'\\"{p["name"]}\\": " + ' + (
+            f'JsonNumber({p["name"]})' if p["type"] == "double"
+            else f'{p["name"]}.ToString(System.Globalization.CultureInfo.InvariantCulture)'
+        ) + ' + "'
         for p in endpoint.parameters
     ])
     json_construction = f'"{{\\\"data\\\": {{{json_parts}}}}}"'
 
+    # Arguments forwarded to the worker that makes the HTTP call
+    call_args = ", ".join(p["name"] for p in endpoint.parameters)
+    call_params = ", ".join(f'{p["type"]} {p["name"]}' for p in endpoint.parameters)
+
     # Base64 encode credentials
     credentials = f'{endpoint.username}:{endpoint.password}'
     auth_header = base64.b64encode(credentials.encode()).decode()
 
     method = f'''
+        private static readonly AuthenticationHeaderValue {endpoint.name}Auth =
+            new AuthenticationHeaderValue("Basic", "{auth_header}");
+
         /// <summary>
         /// {endpoint.description}
         /// </summary>
@@ -123,38 +133,30 @@ def generate_udf_method(endpoint: EndpointConfig) -> str:
             Description = "{endpoint.description}",
             Category = "Domino Model APIs",
             IsVolatile = false,
-            IsExceptionSafe = true
+            IsExceptionSafe = true,
+            IsThreadSafe = false
         )]
         public static object {endpoint.name}(
             {param_section})
+        {{
+            // The HTTP call runs on a worker and the cell shows #N/A until it completes,
+            // so Excel stays responsive and other cells can call out concurrently
+            return ExcelAsyncUtil.Run("{endpoint.name}", new object[] {{ {call_args} }}, () => Call{endpoint.name}({call_args}));
+        }}
+
+        private static object Call{endpoint.name}({call_params})
         {{
             try
             {{
-                // Force TLS 1.2 (required for modern HTTPS endpoints)
-                ServicePointManager.SecurityProtocol = SecurityProtocolType.Tls12 | SecurityProtocolType.Tls13;
-
                 string url = "{endpoint.url}";
                 string jsonPayload = {json_construction};
 
-                using (var client = new WebClient())
-                {{
-                    client.Headers[HttpRequestHeader.ContentType] = "application/json";
-                    client.Headers[HttpRequestHeader.Authorization] = "Basic {auth_header}";
-
-                    string response = client.UploadString(url, "POST", jsonPayload);
-                    return ParseResult(response);
-                }}
+                return PostJson(url, {endpoint.name}Auth, jsonPayload);
             }}
-            catch (WebException ex)
+            catch (HttpRequestException ex)
             {{
-                if (ex.Response != null)
-                {{
-                    using (var reader = new StreamReader(ex.Response.GetResponseStream()))
-                    {{
-                        return "API Error: " + reader.ReadToEnd();
-                    }}
-                }}
-                return "Error: " + ex.Message;
+                // The underlying WebException carries the useful message (DNS, TLS, refused)
+                return "Error: " + ex.GetBaseException().Message;
             }}
             catch (Exception ex)
             {{
@@ -172,9 +174,11 @@ def generate_csharp_code() -> str:
 
     code = f'''using System;
 using System.Collections.Generic;
-using System.IO;
+using System.Globalization;
 using System.Net;
-using System.Text.RegularExpressions;
+using System.Net.Http;
+using System.Net.Http.Headers;
+using System.Text;
 using ExcelDna.Integration;
 
 /// <summary>
@@ -188,149 +192,320 @@ using ExcelDna.Integration;
 /// </summary>
 public static class DominoModelFunctions
 {{
+    // One client for every UDF so recalculations reuse pooled keep-alive connections
+    private static readonly HttpClient Client = CreateClient();
+
+    private static HttpClient CreateClient()
+    {{
+        // Force TLS 1.2 (required for modern HTTPS endpoints)
+        ServicePointManager.SecurityProtocol = SecurityProtocolType.Tls12 | SecurityProtocolType.Tls13;
+        return new HttpClient();
+    }}
+
     /// <summary>
-    /// Extracts the "result" field from the JSON response and returns it as Excel-friendly output.
-    /// Handles single values, 1D arrays (horizontal spill), and 2D arrays (grid spill).
+    /// Formats a double as a JSON number. NaN and Infinity have no JSON literal, so they are sent as null.
     /// </summary>
-    private static object ParseResult(string json)
+    private static string JsonNumber(double value)
     {{
-        // Find the "result" field using regex (lightweight, no external JSON dependency)
-        var resultMatch = Regex.Match(json, @"""result""\s*:\s*(\[[\s\S]*?\]|[^,\}}]+)");
-        if (!resultMatch.Success)
+        if (double.IsNaN(value) || double.IsInfinity(value))
         {{
-            return "Error: No result field in response";
+            return "null";
         }}
+        // "R" round-trips the full value; the default format on .NET Framework keeps only 15 digits
+        return value.ToString("R", CultureInfo.InvariantCulture);
+    }}
+
+    /// <summary>
+    /// POSTs the JSON payload to a model endpoint and returns the parsed result.
+    /// </summary>
+    private static object PostJson(string url, AuthenticationHeaderValue auth, string jsonPayload)
+    {{
+        using (var request = new HttpRequestMessage(HttpMethod.Post, url))
+        {{
+            request.Content = new StringContent(jsonPayload, Encoding.UTF8, "application/json");
+            request.Headers.Authorization = auth;
 
-        string resultValue = resultMatch.Groups[1].Value.Trim();
+            using (var response = Client.SendAsync(request).GetAwaiter().GetResult())
+            {{
+                // Parse the UTF-8 body in place instead of decoding all of it to a string first
+                byte[] body = response.Content.ReadAsByteArrayAsync().GetAwaiter().GetResult();
+                if (!response.IsSuccessStatusCode)
+                {{
+                    return "API Error: " + Encoding.UTF8.GetString(body);
+                }}
+                return ParseResult(body);
+            }}
+        }}
+    }}
 
-        // Check if it's a 2D array (array of arrays) like [[1,2],[3,4]]
-        if (resultValue.StartsWith("[["))
+    /// <summary>
+    /// Extracts the "result" field from the JSON response and returns it as Excel-friendly output.
+    /// Handles single values, 1D arrays (horizontal spill), and 2D arrays (grid spill).
+    /// </summary>
+    private static object ParseResult(byte[] json)
+    {{
+        int i = FindResultValue(json);
+        if (i < 0)
         {{
-            return Parse2DArray(resultValue);
+            return "Error: No result field in response";
         }}
-        // Check if it's a 1D array like [1,2,3]
-        else if (resultValue.StartsWith("[") && resultValue.EndsWith("]"))
+
+        object value;
+        try
         {{
-            return Parse1DArray(resultValue);
+            value = ReadValue(json, ref i);
         }}
-        else
+        catch (FormatException ex)
         {{
-            // Single value
-            return ParseSingleValue(resultValue);
+            return "Error: " + ex.Message;
         }}
+
+        var items = value as List<object>;
+        return items == null ? value : ToSpillArray(items);
     }}
 
     /// <summary>
-    /// Parses a 2D array like [[1,2,3],[4,5,6]] into an Excel-compatible object[,] for grid spill.
+    /// Returns the index just past the colon of the "result" key, or -1 if the key is missing.
     /// </summary>
-    private static object Parse2DArray(string arrayStr)
+    private static int FindResultValue(byte[] json)
     {{
-        // Extract inner arrays using regex to find each [...] row
-        var rowMatches = Regex.Matches(arrayStr, @"\[([^\[\]]*)\]");
-        if (rowMatches.Count == 0)
+        for (int i = 0; i <= json.Length - ResultKey.Length; i++)
         {{
-            return "Error: Invalid 2D array format";
+            int k = 0;
+            while (k < ResultKey.Length && json[i + k] == ResultKey[k])
+            {{
+                k++;
+            }}
+            if (k < ResultKey.Length)
+            {{
+                continue;
+            }}
+            int j = i + k;
+            SkipWhitespace(json, ref j);
+            if (j < json.Length && json[j] == ':')
+            {{
+                return j + 1;
+            }}
         }}
+        return -1;
+    }}
 
-        // Parse each row to get dimensions and values
-        var rows = new List<List<object>>();
-        int maxCols = 0;
+    private static readonly byte[] ResultKey = Encoding.ASCII.GetBytes("\\"result\\"");
+
+    private static bool IsWhitespace(byte ch)
+    {{
+        return ch == ' ' || ch == '\\t' || ch == '\\n' || ch == '\\r';
+    }}
 
-        foreach (Match rowMatch in rowMatches)
+    private static void SkipWhitespace(byte[] json, ref int i)
+    {{
+        while (i < json.Length && IsWhitespace(json[i]))
         {{
-            string rowContent = rowMatch.Groups[1].Value;
-            var rowValues = new List<object>();
+            i++;
+        }}
+    }}
+
+    /// <summary>
+    /// Reads one JSON value starting at i in a single forward pass (no regex, no intermediate splits).
+    /// Arrays become List&lt;object&gt;, numbers become double, objects are returned as raw JSON text.
+    /// </summary>
+    private static object ReadValue(byte[] json, ref int i)
+    {{
+        SkipWhitespace(json, ref i);
+        if (i >= json.Length)
+        {{
+            throw new FormatException("Empty result field in response");
+        }}
 
-            if (!string.IsNullOrWhiteSpace(rowContent))
+        byte ch = json[i];
+        if (ch == '[')
+        {{
+            i++;
+            var items = new List<object>();
+            SkipWhitespace(json, ref i);
+            if (i < json.Length && json[i] == ']')
             {{
-                var parts = rowContent.Split(new[] {{ ',' }}, StringSplitOptions.RemoveEmptyEntries);
-                foreach (var part in parts)
-                {{
-                    rowValues.Add(ParseSingleValue(part.Trim()));
-                }}
+                i++;
+                return items;
             }}
-
-            rows.Add(rowValues);
-            if (rowValues.Count > maxCols)
+            while (true)
             {{
-                maxCols = rowValues.Count;
+                items.Add(ReadValue(json, ref i));
+                SkipWhitespace(json, ref i);
+                if (i >= json.Length)
+                {{
+                    throw new FormatException("Unterminated result array in response");
+                }}
+                if (json[i] == ',')
+                {{
+                    i++;
+                    continue;
+                }}
+                if (json[i] == ']')
+                {{
+                    i++;
+                    return items;
+                }}
+                throw new FormatException("Invalid array in result field");
             }}
         }}
+        if (ch == '"')
+        {{
+            return ReadString(json, ref i);
+        }}
+        if (ch == '{{')
+        {{
+            return ReadObjectText(json, ref i);
+        }}
 
-        // Handle edge cases
-        if (rows.Count == 0 || maxCols == 0)
+        int start = i;
+        while (i < json.Length && json[i] != ',' && json[i] != ']' && json[i] != '}}' && !IsWhitespace(json[i]))
         {{
-            return "";
+            i++;
         }}
-        if (rows.Count == 1 && rows[0].Count == 1)
+        string token = Encoding.ASCII.GetString(json, start, i - start);
+        if (double.TryParse(token, NumberStyles.Float, CultureInfo.InvariantCulture, out double numVal))
         {{
-            return rows[0][0];
+            return numVal;
         }}
+        return token;
+    }}
 
-        // Create 2D array for Excel grid spill
-        object[,] spillArray = new object[rows.Count, maxCols];
-        for (int r = 0; r < rows.Count; r++)
+    private static string ReadString(byte[] json, ref int i)
+    {{
+        // Multi-byte UTF-8 sequences never contain '"' or '\\\\', so unescaped runs are decoded whole
+        var sb = new StringBuilder();
+        int run = i + 1;
+        for (i = run; i < json.Length; i++)
         {{
-            for (int c = 0; c < maxCols; c++)
+            byte ch = json[i];
+            if (ch == '"')
+            {{
+                sb.Append(Encoding.UTF8.GetString(json, run, i - run));
+                i++;
+                return sb.ToString();
+            }}
+            if (ch != '\\\\')
+            {{
+                continue;
+            }}
+            sb.Append(Encoding.UTF8.GetString(json, run, i - run));
+            if (++i >= json.Length)
+            {{
+                break;
+            }}
+            run = i + 1;
+            switch ((char)json[i])
+            {{
+                case 'n': sb.Append('\\n'); break;
+                case 't': sb.Append('\\t'); break;
+                case 'r': sb.Append('\\r'); break;
+                case 'b': sb.Append('\\b'); break;
+                case 'f': sb.Append('\\f'); break;
+                case 'u':
+                    if (i + 4 < json.Length)
+                    {{
+                        sb.Append((char)Convert.ToInt32(Encoding.ASCII.GetString(json, i + 1, 4), 16));
+                        i += 4;
+                        run = i + 1;
+                    }}
+                    break;
+                default: sb.Append((char)json[i]); break;
+            }}
+        }}
+        throw new FormatException("Unterminated string in result field");
+    }}
+
+    private static string ReadObjectText(byte[] json, ref int i)
+    {{
+        int start = i;
+        int depth = 0;
+        bool inString = false;
+        for (; i < json.Length; i++)
+        {{
+            byte ch = json[i];
+            if (inString)
             {{
-                if (c < rows[r].Count)
+                if (ch == '\\\\')
                 {{
-                    spillArray[r, c] = rows[r][c];
+                    i++;
                 }}
-                else
+                else if (ch == '"')
                 {{
-                    spillArray[r, c] = ""; // Pad jagged arrays
+                    inString = false;
                 }}
             }}
+            else if (ch == '"')
+            {{
+                inString = true;
+            }}
+            else if (ch == '{{')
+            {{
+                depth++;
+            }}
+            else if (ch == '}}' && --depth == 0)
+            {{
+                i++;
+                return Encoding.UTF8.GetString(json, start, i - start);
+            }}
         }}
-        return spillArray;
+        throw new FormatException("Unterminated object in result field");
     }}
 
     /// <summary>
-    /// Parses a 1D array like [1,2,3] into an Excel-compatible object[,] for horizontal spill.
+    /// Converts a parsed result array into an Excel-compatible object[,]: a 1-row horizontal
+    /// spill for flat arrays, or a grid spill (jagged rows padded) for arrays of arrays.
     /// </summary>
-    private static object Parse1DArray(string arrayStr)
+    private static object ToSpillArray(List<object> items)
     {{
-        string inner = arrayStr.Substring(1, arrayStr.Length - 2).Trim();
-        if (string.IsNullOrEmpty(inner))
+        bool isGrid = false;
+        foreach (var item in items)
         {{
-            return "";
+            if (item is List<object>)
+            {{
+                isGrid = true;
+                break;
+            }}
         }}
 
-        var parts = inner.Split(new[] {{ ',' }}, StringSplitOptions.RemoveEmptyEntries);
-        var results = new List<object>();
-
-        foreach (var part in parts)
+        var rows = new List<List<object>>();
+        if (isGrid)
+        {{
+            foreach (var item in items)
+            {{
+                rows.Add(item as List<object> ?? new List<object> {{ item }});
+            }}
+        }}
+        else
         {{
-            results.Add(ParseSingleValue(part.Trim()));
+            rows.Add(items);
         }}
 
-        if (results.Count == 1)
+        int maxCols = 0;
+        foreach (var row in rows)
         {{
-            return results[0];
+            maxCols = Math.Max(maxCols, row.Count);
         }}
 
-        // Create a 1-row, N-column array for horizontal spill
-        object[,] spillArray = new object[1, results.Count];
-        for (int i = 0; i < results.Count; i++)
+        // Handle edge cases
+        if (rows.Count == 0 || maxCols == 0)
         {{
-            spillArray[0, i] = results[i];
+            return "";
+        }}
+        if (rows.Count == 1 && rows[0].Count == 1)
+        {{
+            return rows[0][0];
         }}
-        return spillArray;
-    }}
 
-    /// <summary>
-    /// Parses a single value (number or string) into the appropriate type.
-    /// </summary>
-    private static object ParseSingleValue(string value)
-    {{
-        string trimmed = value.Trim();
-        if (double.TryParse(trimmed, System.Globalization.NumberStyles.Any,
-            System.Globalization.CultureInfo.InvariantCulture, out double numVal))
+        object[,] spillArray = new object[rows.Count, maxCols];
+        for (int r = 0; r < rows.Count; r++)
         {{
-            return numVal;
+            for (int c = 0; c < maxCols; c++)
+            {{
+                spillArray[r, c] = c < rows[r].Count ? rows[r][c] : ""; // Pad jagged arrays
+            }}
         }}
-        return trimmed.Trim('"');
+        return spillArray;
     }}
 
 {methods}
@@ -386,6 +561,9 @@ def build_addin():
   <ItemGroup>
     <PackageReference Include="ExcelDna.AddIn" Version="1.7.0" />
   </ItemGroup>
+  <ItemGroup>
+    <Reference Include="System.Net.Http" />
+  </ItemGroup>
 </Project>
 '''
         csproj_file = os.path.join(build_dir, "DominoModelFunctions.csproj")
@@ -13,17 +13,26 @@ parameter descriptions, and error handling.
 """
 
 import base64
-import html
+import hashlib
 import json
 import os
 import re
+import shlex
 import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from html.parser import HTMLParser
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Environment configuration
 DOMINO_URL = os.environ.get("DOMINO_URL", "https://se-demo.domino.tech:443")
@@ -31,6 +40,28 @@ API_KEY = os.environ.get("DOMINO_USER_API_KEY", "")
 PROJECT_ID = os.environ.get("DOMINO_PROJECT_ID", "")
 OFFICE_ADDIN_HOSTED_URL = os.environ.get("DOMINO_OFFICE_ADDIN_URL", "").strip()
 
+# One keep-alive connection pool shared by every Domino/MLflow call
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# Models are discovered concurrently; each one costs an overview page and an MLflow lookup
+DISCOVERY_WORKERS = 16
+
+# Registered model versions are immutable, so their artifacts are kept between runs
+ARTIFACT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "domino_udf_artifacts")
+
+# Restored NuGet packages (ExcelDna.AddIn). Home directories do not survive between Domino
+# runs, so the cache goes in the project's local dataset when one is mounted; it is kept out
+# of the project files, which Domino syncs. NUGET_PACKAGES overrides the location, and with
+# neither set dotnet uses its default per-user cache.
+_PROJECT_DATASET_DIR = os.path.join("/domino/datasets/local", os.environ.get("DOMINO_PROJECT_NAME", ""))
+NUGET_PACKAGES_DIR = os.environ.get("NUGET_PACKAGES") or (
+    os.path.join(_PROJECT_DATASET_DIR, ".nuget", "packages")
+    if os.environ.get("DOMINO_PROJECT_NAME") and os.path.isdir(_PROJECT_DATASET_DIR) else ""
+)
+
 
 @dataclass
 class EndpointConfig:
@@ -52,18 +83,24 @@ def get_models(project_id: str) -> list:
     """Get all models for a project."""
     url = f"{DOMINO_URL}/v4/modelManager/getModels"
     headers = {"X-Domino-Api-Key": API_KEY}
-    resp = requests.get(url, params={"projectId": project_id}, headers=headers, timeout=30)
+    resp = SESSION.get(url, params={"projectId": project_id}, headers=headers, timeout=30)
     resp.raise_for_status()
     return resp.json()
 
 
+def _read_json_file(path: str) -> Any:
+    """Parse a JSON file, using orjson when it is installed."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
 def _load_input_example(local_dir: str) -> dict | None:
     """Load the input example from MLflow artifacts, if present."""
     for fname in ("serving_input_example.json", "input_example.json"):
         path = os.path.join(local_dir, fname)
         if os.path.exists(path):
-            with open(path) as f:
-                example = json.load(f)
+            example = _read_json_file(path)
             # Convert dataframe_split format to simple dict
             if "dataframe_split" in example:
                 cols = example["dataframe_split"]["columns"]
@@ -120,6 +157,26 @@ def _load_signature_inputs(local_dir: str) -> list[dict[str, Any]] | None:
     return inputs
 
 
+def _download_model_artifacts(source: str) -> str:
+    """Download a model version's artifacts, reusing the copy from an earlier run if present."""
+    from mlflow import artifacts
+
+    cache_dir = os.path.join(ARTIFACT_CACHE_DIR, hashlib.sha256(source.encode()).hexdigest()[:32])
+    marker = os.path.join(cache_dir, ".local_path")
+    if os.path.exists(marker):
+        with open(marker) as f:
+            local_dir = f.read()
+        if os.path.isdir(local_dir):
+            return local_dir
+
+    os.makedirs(cache_dir, exist_ok=True)
+    local_dir = artifacts.download_artifacts(artifact_uri=source, dst_path=cache_dir)
+    # Written last so an interrupted download is never mistaken for a complete one
+    with open(marker, "w") as f:
+        f.write(local_dir)
+    return local_dir
+
+
 def get_model_signature(model_name: str, model_version: int) -> dict | None:
     """Get the signature and input example for a registered model version from MLflow."""
     tracking_uri = os.environ.get("MLFLOW_TRACKING_URI", "")
@@ -128,7 +185,7 @@ def get_model_signature(model_name: str, model_version: int) -> dict | None:
 
     # Get the model version info to find the artifact source
     url = f"{tracking_uri.rstrip('/')}/api/2.0/mlflow/model-versions/get"
-    resp = requests.get(url, params={"name": model_name, "version": model_version}, timeout=15)
+    resp = SESSION.get(url, params={"name": model_name, "version": model_version}, timeout=15)
     if resp.status_code != 200:
         return None
 
@@ -138,9 +195,8 @@ def get_model_signature(model_name: str, model_version: int) -> dict | None:
 
     # Download the model artifacts and parse signature + input example
     try:
-        from mlflow import artifacts
         os.environ.setdefault("MLFLOW_ENABLE_ARTIFACTS_PROGRESS_BAR", "false")
-        local_dir = artifacts.download_artifacts(artifact_uri=source)
+        local_dir = _download_model_artifacts(source)
 
         signature_inputs = _load_signature_inputs(local_dir)
         example = _load_input_example(local_dir)
@@ -152,24 +208,53 @@ def get_model_signature(model_name: str, model_version: int) -> dict | None:
     return None
 
 
+class _CurlTabParser(HTMLParser):
+    """Collect the text of the first <pre> inside the curl tab of a model overview page."""
+
+    def __init__(self):
+        super().__init__()
+        self.done = False
+        self._in_tab = False
+        self._in_pre = False
+        self._parts: list[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "div" and dict(attrs).get("id") == "language-curl":
+            self._in_tab = True
+        elif tag == "pre" and self._in_tab and not self.done:
+            self._in_pre = True
+
+    def handle_endtag(self, tag):
+        if tag == "pre" and self._in_pre:
+            self._in_pre = False
+            self.done = True
+
+    def handle_data(self, data):
+        if self._in_pre:
+            self._parts.append(data)
+
+    @property
+    def curl(self) -> str | None:
+        return "".join(self._parts).strip() if self.done else None
+
+
 def get_curl_from_html(model_id: str) -> str | None:
     """Fetch the model overview page and extract the curl command."""
     url = f"{DOMINO_URL}/models/{model_id}/overview"
     headers = {"X-Domino-Api-Key": API_KEY}
-    resp = requests.get(url, headers=headers, timeout=15)
-    if resp.status_code != 200:
-        return None
+    with SESSION.get(url, headers=headers, timeout=15, stream=True) as resp:
+        if resp.status_code != 200:
+            return None
+        resp.encoding = resp.encoding or "utf-8"
 
-    # Extract curl from the HTML
-    match = re.search(
-        r'<div role="tabpanel" class="tab-pane" id="language-curl">.*?<pre[^>]*>(.*?)</pre>',
-        resp.text,
-        flags=re.S | re.I,
-    )
-    if not match:
-        return None
+        # Parse the page as it arrives and stop parsing once the curl <pre> closes. The
+        # rest is still read to EOF so the keep-alive connection goes back to the pool.
+        parser = _CurlTabParser()
+        for chunk in resp.iter_content(chunk_size=16384, decode_unicode=True):
+            if not parser.done:
+                parser.feed(chunk)
 
-    return html.unescape(match.group(1)).strip()
+    return parser.curl
 
 
 def parse_curl_command(curl_text: str) -> dict | None:
@@ -181,31 +266,28 @@ def parse_curl_command(curl_text: str) -> dict | None:
     if not curl_text:
         return None
 
-    result = {}
+    # Tokenize once with shell quoting rules; line continuations are just whitespace
+    try:
+        tokens = shlex.split(curl_text.replace("\\\n", " "))
+    except ValueError:
+        return None
 
-    # Extract URL - look for the URL in the curl command
-    # Usually follows 'curl' and comes before or after flags
-    url_match = re.search(r'https?://[^\s\'"]+', curl_text)
-    if url_match:
-        result['url'] = url_match.group(0)
-
-    # Extract basic auth credentials (-u or --user flag)
-    # Format: -u username:password or --user username:password
-    auth_match = re.search(r'(?:-u|--user)\s+[\'"]?([^:]+):([^\s\'"]+)[\'"]?', curl_text)
-    if auth_match:
-        result['username'] = auth_match.group(1)
-        result['password'] = auth_match.group(2)
-
-    # Extract the data payload (-d flag)
-    # Could be -d 'JSON' or -d "JSON"
-    data_match = re.search(r"-d\s+'([^']*)'", curl_text)
-    if not data_match:
-        data_match = re.search(r'-d\s+"([^"]*)"', curl_text)
-    if data_match:
-        try:
-            result['data'] = json.loads(data_match.group(1))
-        except json.JSONDecodeError:
-            result['data'] = None
+    result = {}
+    for i, token in enumerate(tokens):
+        value = tokens[i + 1] if i + 1 < len(tokens) else None
+        if 'url' not in result and token.startswith(("http://", "https://")):
+            result['url'] = token
+        elif token in ("-u", "--user") and value and 'username' not in result:
+            # Format: -u username:password
+            username, sep, password = value.partition(":")
+            if sep and username and password:
+                result['username'] = username
+                result['password'] = password
+        elif token in ("-d", "--data", "--data-raw") and value is not None and 'data' not in result:
+            try:
+                result['data'] = json.loads(value)
+            except json.JSONDecodeError:
+                result['data'] = None
 
     return result if 'url' in result else None
 
@@ -367,42 +449,49 @@ def clean_function_name(name: str) -> str:
     return camel or 'UnnamedModel'
 
 
+def _fetch_model_sources(model: dict) -> tuple[str | None, dict | None, dict | None]:
+    """Fetch the overview curl and, if it parses, the MLflow signature for one model."""
+    curl_text = get_curl_from_html(model["id"])
+    if not curl_text:
+        return None, None, None
+
+    curl_info = parse_curl_command(curl_text)
+    if not curl_info or 'username' not in curl_info or 'password' not in curl_info:
+        return curl_text, None, None
+
+    active = model.get("activeVersion") or {}
+    registered_name = active.get("registeredModelName")
+    registered_version = active.get("registeredModelVersion")
+    signature = None
+    if registered_name and registered_version:
+        signature = get_model_signature(registered_name, registered_version)
+    return curl_text, curl_info, signature
+
+
 def discover_endpoints(project_id: str) -> list[EndpointConfig]:
     """
     Discover all model endpoints in a project and build EndpointConfig objects.
     """
     endpoints = []
-    models = get_models(project_id)
+    models = [model for model in get_models(project_id) if model.get("id")]
 
-    for model in models:
-        model_id = model.get("id")
-        name = model.get("name", "UnnamedModel")
-        active = model.get("activeVersion") or {}
-        registered_name = active.get("registeredModelName")
-        registered_version = active.get("registeredModelVersion")
+    # Network fetches run concurrently; results are consumed in model order
+    with ThreadPoolExecutor(max_workers=DISCOVERY_WORKERS) as pool:
+        sources = list(pool.map(_fetch_model_sources, models))
 
-        if not model_id:
-            continue
+    for model, (curl_text, curl_info, signature) in zip(models, sources):
+        name = model.get("name", "UnnamedModel")
 
         print(f"  Discovering: {name}...")
 
-        # Get the curl from the overview page
-        curl_text = get_curl_from_html(model_id)
         if not curl_text:
             print(f"    (skipped - no curl found)")
             continue
 
-        # Parse the curl command
-        curl_info = parse_curl_command(curl_text)
-        if not curl_info or 'username' not in curl_info or 'password' not in curl_info:
+        if not curl_info:
             print(f"    (skipped - could not parse curl)")
             continue
 
-        # Try to get the signature from MLflow
-        signature = None
-        if registered_name and registered_version:
-            signature = get_model_signature(registered_name, registered_version)
-
         signature_inputs = None
         example_data = None
         if signature:
@@ -497,6 +586,12 @@ def generate_udf_method(endpoint: EndpointConfig) -> str:
         param_section_parts.append(f'{excel_arg} {param_type} {p["name"]}')
 
     param_section = ", ".join(param_section_parts)
+    param_names = [p["name"] for p in endpoint.parameters]
+    call_params = ", ".join(f"object {name}" for name in param_names)
+    call_args = ", ".join(param_names)
+    normalize_lines = "".join(
+        f"            {name} = NormalizeExcelValue({name});\n" for name in param_names
+    )
 
     # Build JSON payload construction based on parameter types
     # We generate C# code that builds a proper JSON string with concatenation
@@ -542,6 +637,9 @@ def generate_udf_method(endpoint: EndpointConfig) -> str:
     help_topic_line = f',\n            HelpTopic = "{help_topic_url}"' if help_topic_url else ''
 
     method = f'''
+        private static readonly AuthenticationHeaderValue {endpoint.name}Auth =
+            new AuthenticationHeaderValue("Basic", "{auth_header}");
+
         /// <summary>
         /// {endpoint.description}
         /// </summary>
@@ -552,38 +650,29 @@ def generate_udf_method(endpoint: EndpointConfig) -> str:
             Category = "Domino Model APIs",
             IsVolatile = false,
             IsExceptionSafe = true,
-            IsThreadSafe = true{help_topic_line}
+            IsThreadSafe = false{help_topic_line}
         )]
         public static object {endpoint.name}(
             {param_section})
+        {{
+            // Resolve cell references on Excel's thread; the HTTP call runs on a worker and
+            // the cell shows #N/A until it completes, so other cells can call out concurrently
+{normalize_lines}            return ExcelAsyncUtil.Run("{excel_function_name}", new object[] {{ {call_args} }}, () => Call{endpoint.name}({call_args}));
+        }}
+
+        private static object Call{endpoint.name}({call_params})
         {{
             try
             {{
-                // Force TLS 1.2 (required for modern HTTPS endpoints)
-                ServicePointManager.SecurityProtocol = SecurityProtocolType.Tls12 | SecurityProtocolType.Tls13;
-
                 string url = "{endpoint.url}";
                 string jsonPayload = {json_construction};
 
-                using (var client = new WebClient())
-                {{
-                    client.Headers[HttpRequestHeader.ContentType] = "application/json";
-                    client.Headers[HttpRequestHeader.Authorization] = "Basic {auth_header}";
-
-                    string response = client.UploadString(url, "POST", jsonPayload);
-                    return ParseResult(response);
-                }}
+                return PostJson(url, {endpoint.name}Auth, jsonPayload);
             }}
-            catch (WebException ex)
+            catch (HttpRequestException ex)
             {{
-                if (ex.Response != null)
-                {{
-                    using (var reader = new StreamReader(ex.Response.GetResponseStream()))
-                    {{
-                        return "API Error: " + reader.ReadToEnd();
-                    }}
-                }}
-                return "Error: " + ex.Message;
+                // The underlying WebException carries the useful message (DNS, TLS, refused)
+                return "Error: " + ex.GetBaseException().Message;
             }}
             catch (Exception ex)
             {{
@@ -607,6 +696,8 @@ using System.Collections.Generic;
 using System.Globalization;
 using System.IO;
 using System.Net;
+using System.Net.Http;
+using System.Net.Http.Headers;
 using System.Text;
 using System.Text.RegularExpressions;
 using ExcelDna.Integration;
@@ -622,6 +713,52 @@ using ExcelDna.Integration;
 /// </summary>
 public static class DominoModelFunctions
 {{
+    // One client for every UDF so recalculations reuse pooled keep-alive connections
+    private static readonly HttpClient Client = CreateClient();
+
+    // Per-thread request body buffer, grown as needed and reused across calls
+    [ThreadStatic]
+    private static byte[] _payloadBuffer;
+
+    private static HttpClient CreateClient()
+    {{
+        // Force TLS 1.2 (required for modern HTTPS endpoints)
+        ServicePointManager.SecurityProtocol = SecurityProtocolType.Tls12 | SecurityProtocolType.Tls13;
+        return new HttpClient();
+    }}
+
+    /// <summary>
+    /// POSTs the JSON payload to a model endpoint and returns the parsed result.
+    /// </summary>
+    private static object PostJson(string url, AuthenticationHeaderValue auth, string jsonPayload)
+    {{
+        int maxBytes = Encoding.UTF8.GetMaxByteCount(jsonPayload.Length);
+        if (_payloadBuffer == null || _payloadBuffer.Length < maxBytes)
+        {{
+            _payloadBuffer = new byte[Math.Max(maxBytes, 4096)];
+        }}
+        int byteCount = Encoding.UTF8.GetBytes(jsonPayload, 0, jsonPayload.Length, _payloadBuffer, 0);
+
+        using (var request = new HttpRequestMessage(HttpMethod.Post, url))
+        using (var content = new ByteArrayContent(_payloadBuffer, 0, byteCount))
+        {{
+            content.Headers.ContentType = new MediaTypeHeaderValue("application/json");
+            request.Content = content;
+            request.Headers.Authorization = auth;
+
+            // The send completes before this thread can reuse the buffer
+            using (var response = Client.SendAsync(request).GetAwaiter().GetResult())
+            {{
+                string body = response.Content.ReadAsStringAsync().GetAwaiter().GetResult();
+                if (!response.IsSuccessStatusCode)
+                {{
+                    return "API Error: " + body;
+                }}
+                return ParseResult(body);
+            }}
+        }}
+    }}
+
     private enum ParamKind
     {{
         String,
@@ -1219,7 +1356,7 @@ def get_project_name(project_id: str) -> str:
     url = f"{DOMINO_URL}/v4/projects/{project_id}"
     headers = {"X-Domino-Api-Key": API_KEY}
     try:
-        resp = requests.get(url, headers=headers, timeout=15)
+        resp = SESSION.get(url, headers=headers, timeout=15)
         resp.raise_for_status()
         data = resp.json()
         name = data.get("name", "DOMINO")
@@ -1602,6 +1739,34 @@ def package_office_addin(endpoints: list[EndpointConfig], project_name: str, hos
     return files
 
 
+def minify_addin_file(filename: str, content: str) -> str:
+    """
+    Strip comments and insignificant whitespace from an add-in file before embedding.
+
+    JSON and XML are compacted with the standard library; JS and HTML are only
+    minified when rjsmin/htmlmin are installed, otherwise they are left untouched.
+    """
+    ext = os.path.splitext(filename)[1]
+    if ext == ".json":
+        return json.dumps(json.loads(content), separators=(",", ":"), ensure_ascii=False)
+    if ext == ".xml":
+        content = re.sub(r"<!--.*?-->", "", content, flags=re.DOTALL)
+        return re.sub(r">\s+<", "><", content).strip()
+    if ext == ".js":
+        try:
+            import rjsmin
+        except ImportError:
+            return content
+        return rjsmin.jsmin(content)
+    if ext == ".html":
+        try:
+            import htmlmin
+        except ImportError:
+            return content
+        return htmlmin.minify(content, remove_comments=True, remove_empty_space=True)
+    return content
+
+
 def generate_static_server_code(addin_files: dict[str, str], endpoints: list[EndpointConfig]) -> str:
     """
     Generate Python Flask app code that serves Office Add-in files via query parameter.
@@ -1616,112 +1781,439 @@ def generate_static_server_code(addin_files: dict[str, str], endpoints: list[End
     # Embed all files as Python string literals
     file_literals = []
     for filename, content in addin_files.items():
-        escaped = escape_for_python(content)
+        escaped = escape_for_python(minify_addin_file(filename, content))
         file_literals.append(f"    '{filename}': ('''{escaped}''', get_mimetype('{filename}'))")
 
     files_dict = ",\n".join(file_literals)
 
-    allowed_urls = ",\n".join([f"    '{ep.url}'" for ep in endpoints])
+    # Emit the shared scheme/host/path prefix once and only the per-model suffixes
+    endpoint_urls = [ep.url for ep in endpoints]
+    url_base = os.path.commonprefix(endpoint_urls)
+    url_base = url_base[:url_base.rfind('/') + 1]
+    model_url_suffixes = "".join(f"    '{url[len(url_base):]}',\n" for url in endpoint_urls)
 
     model_py = f'''"""
 Domino Office Add-in Static File Server
 Auto-generated Flask app to serve Office Add-in files
 """
 
-import requests
-from flask import Flask, Response, request
+import atexit
+import gzip
+import hashlib
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from collections import OrderedDict, namedtuple
+
+import httpx
+import orjson
+from flask import Flask, Response, request, send_file
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Production `python model.py` hands the process to gunicorn before anything is
+# precomputed: exec skips atexit, so a temp dir built here would never be removed.
+# The workers import this module through wsgi.py and build their assets there.
+# Running it as `python -m gunicorn` does not depend on gunicorn's script being on PATH.
+if __name__ == '__main__' and len(sys.argv) == 1 and os.environ.get('FLASK_ENV') != 'development':
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        if importlib.util.find_spec('gunicorn') is None:
+            raise OSError('gunicorn is not installed')
+        os.execv(sys.executable, [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn_conf.py', 'wsgi:app'])
+    except OSError as exc:
+        print(f'WARNING: could not start gunicorn ({{exc}}); falling back to the Flask development server', file=sys.stderr)
 
 app = Flask(__name__)
+# Let a fronting Apache/lighttpd stream files itself when it honors X-Sendfile
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE', '').lower() in ('1', 'true', 'yes')
+
+_MT = {{
+    '.xml': 'application/xml',
+    '.json': 'application/json',
+    '.js': 'application/javascript',
+    '.html': 'text/html',
+}}
 
 def get_mimetype(filename):
     """Get MIME type based on file extension."""
-    if filename.endswith('.xml'):
-        return 'application/xml'
-    elif filename.endswith('.json'):
-        return 'application/json'
-    elif filename.endswith('.js'):
-        return 'application/javascript'
-    elif filename.endswith('.html'):
-        return 'text/html'
-    else:
-        return 'text/plain'
+    return _MT.get(filename[filename.rfind('.'):], 'text/plain')
 
 # Embedded files (generated at build time)
 FILES = {{
 {files_dict}
 }}
 
-ALLOWED_URLS = {{
-{allowed_urls}
+# Encoded bodies, compressed variants, and validators are computed once at import
+# and written to disk so the WSGI server can hand them to sendfile(2) via
+# wsgi.file_wrapper instead of copying them out of the Python heap per request.
+class PrecomputedAsset:
+    __slots__ = ('path', 'gzip_path', 'br_path', 'etag', 'gzip_etag', 'br_etag', 'mimetype', 'length')
+
+    def __init__(self, path, gzip_path, br_path, etag, mimetype, length):
+        self.path = path
+        self.gzip_path = gzip_path
+        self.br_path = br_path
+        # Strong validators must differ per content-coding, so each variant gets its own
+        self.etag = etag
+        self.gzip_etag = etag + '-gz'
+        self.br_etag = etag + '-br'
+        self.mimetype = mimetype
+        self.length = length
+
+CACHE_MAX_AGE = 3600
+
+STATIC_DIR = tempfile.mkdtemp(prefix='office_addin_')
+_STATIC_OWNER_PID = os.getpid()
+
+def _remove_static_dir():
+    # Forked gunicorn workers inherit this hook; only the creating process cleans up
+    if os.getpid() == _STATIC_OWNER_PID:
+        shutil.rmtree(STATIC_DIR, ignore_errors=True)
+
+atexit.register(_remove_static_dir)
+
+def _write_static(filename, body):
+    path = os.path.join(STATIC_DIR, filename)
+    with open(path, 'wb') as f:
+        f.write(body)
+    return path
+
+def _precompute_asset(name, content, mimetype):
+    raw = content.encode('utf-8')
+    etag = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    path = _write_static(name, raw)
+    gzip_path = _write_static(name + '.gz', gzip.compress(raw, 9))
+    br_path = _write_static(name + '.br', brotli.compress(raw, quality=11)) if brotli is not None else None
+    return PrecomputedAsset(path, gzip_path, br_path, etag, mimetype, len(raw))
+
+FILES = {{name: _precompute_asset(name, content, mimetype) for name, (content, mimetype) in FILES.items()}}
+_F = FILES.get
+
+# Unknown-file misses are common from scanners; answer them without rebuilding the message
+_NOT_FOUND_RESP = Response(
+    ("File not found. Available files: " + ", ".join(FILES)).encode('utf-8'),
+    status=404,
+    mimetype='text/plain',
+)
+
+MODEL_URL_BASE = '{url_base}'
+MODEL_URL_SUFFIXES = (
+{model_url_suffixes})
+
+# Interned once so every worker shares a single copy of each URL and lookups hit on identity
+ALLOWED_URLS = frozenset(sys.intern(MODEL_URL_BASE + suffix) for suffix in MODEL_URL_SUFFIXES)
+
+# Prebuilt upstream headers per allowed model URL; a miss means the URL is not allowed
+_ROUTES = {{url: {{'Content-Type': 'application/json'}} for url in ALLOWED_URLS}}
+
+# Caller headers passed through to the model API
+_FORWARDED_HEADERS = ('Authorization', 'X-Domino-Api-Key', 'Cookie')
+
+_INVALID_TARGET_BODY = b'Invalid or missing target URL.'
+
+# One shared HTTP/2 client for all upstream calls. The model endpoints live on
+# the same host, so concurrent Excel calls from worker threads multiplex over
+# a single TLS connection instead of opening one socket each.
+CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    ),
+    timeout=30,
+)
+
+UPSTREAM_CHUNK_SIZE = 65536
+
+# Upstream responses that carried an ETag, keyed by (url, payload hash). Repeat
+# calls revalidate with If-None-Match (still under the caller's credentials)
+# and replay the cached body when the model answers 304.
+CachedResponse = namedtuple('CachedResponse', ['etag', 'body', 'mimetype'])
+
+UPSTREAM_CACHE_SIZE = 256
+_UPSTREAM_CACHE = OrderedDict()
+_UPSTREAM_CACHE_LOCK = threading.Lock()
+
+def _cache_get(key):
+    with _UPSTREAM_CACHE_LOCK:
+        entry = _UPSTREAM_CACHE.get(key)
+        if entry is not None:
+            _UPSTREAM_CACHE.move_to_end(key)
+        return entry
+
+def _cache_put(key, entry):
+    with _UPSTREAM_CACHE_LOCK:
+        _UPSTREAM_CACHE[key] = entry
+        _UPSTREAM_CACHE.move_to_end(key)
+        while len(_UPSTREAM_CACHE) > UPSTREAM_CACHE_SIZE:
+            _UPSTREAM_CACHE.popitem(last=False)
+
+def _stream_and_cache(upstream, key, etag, mimetype):
+    """Yield upstream chunks, storing the full body once the stream completes."""
+    chunks = []
+    for chunk in upstream.iter_bytes(UPSTREAM_CHUNK_SIZE):
+        chunks.append(chunk)
+        yield chunk
+    _cache_put(key, CachedResponse(etag, b''.join(chunks), mimetype))
+
+_CORS_STATIC = {{
+    'Access-Control-Allow-Credentials': 'true',
+    'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type, Authorization, X-Domino-Api-Key',
 }}
 
 def _cors_response(response: Response) -> Response:
+    response.headers.update(_CORS_STATIC)
+    response.headers['Access-Control-Allow-Origin'] = request.headers.get('Origin', '*')
+    return response
+
+# Browsers cache the preflight for a day, so repeat /proxy calls skip the OPTIONS round-trip
+PREFLIGHT_MAX_AGE = 86400
+_PREFLIGHT_CACHE_SIZE = 64
+_PREFLIGHT_RESPONSES = {{}}
+
+def _preflight_response() -> Response:
+    """Return the constant 204 preflight for the caller's Origin, built once per Origin."""
     origin = request.headers.get('Origin', '*')
-    response.headers['Access-Control-Allow-Origin'] = origin
-    response.headers['Access-Control-Allow-Credentials'] = 'true'
-    response.headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS'
-    response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization, X-Domino-Api-Key'
+    response = _PREFLIGHT_RESPONSES.get(origin)
+    if response is None:
+        response = _cors_response(Response(status=204))
+        response.headers['Access-Control-Max-Age'] = str(PREFLIGHT_MAX_AGE)
+        if len(_PREFLIGHT_RESPONSES) < _PREFLIGHT_CACHE_SIZE:
+            _PREFLIGHT_RESPONSES[origin] = response
     return response
 
+def _negotiate_encoding(asset):
+    """Pick the smallest precomputed variant the client accepts."""
+    accept = request.accept_encodings
+    if asset.br_path is not None and accept['br']:
+        return 'br', asset.br_path, asset.br_etag
+    if accept['gzip']:
+        return 'gzip', asset.gzip_path, asset.gzip_etag
+    return None, asset.path, asset.etag
+
 @app.route('/', methods=['GET'])
 def serve_file():
     """Serve files based on 'file' query parameter."""
     # Get the requested file from query parameter
     requested_file = request.args.get('file', 'index.html')
 
-    if requested_file in FILES:
-        content, mimetype = FILES[requested_file]
-        response = Response(content, mimetype=mimetype)
-        return _cors_response(response)
-
-    return Response("File not found. Available files: " + ", ".join(FILES.keys()), status=404)
+    asset = _F(requested_file)
+    if asset is None:
+        return _NOT_FOUND_RESP
+
+    # send_file answers If-None-Match with a bodiless 304 on its own
+    encoding, path, etag = _negotiate_encoding(asset)
+    response = send_file(
+        path,
+        mimetype=asset.mimetype,
+        download_name=requested_file,
+        etag=etag,
+        max_age=CACHE_MAX_AGE,
+    )
+    if encoding and response.status_code != 304:
+        response.headers['Content-Encoding'] = encoding
+    response.headers['Vary'] = 'Accept-Encoding'
+    return _cors_response(response)
 
 @app.route('/proxy', methods=['POST', 'OPTIONS'])
 def proxy():
     """Proxy requests to Domino Model APIs using the user's session."""
     if request.method == 'OPTIONS':
-        return _cors_response(Response(status=204))
+        return _preflight_response()
 
-    body = request.get_json(silent=True) or {{}}
+    # Parse the raw body once with orjson and forward the payload as bytes,
+    # skipping Werkzeug's JSON cache and a second stdlib encode
+    try:
+        body = orjson.loads(request.get_data(cache=False) or b'{{}}')
+    except orjson.JSONDecodeError:
+        body = {{}}
+    if not isinstance(body, dict):
+        body = {{}}
     target_url = body.get('url')
     payload = body.get('payload')
 
-    if not target_url or target_url not in ALLOWED_URLS:
-        return _cors_response(Response("Invalid or missing target URL.", status=400))
+    base_headers = _ROUTES.get(target_url) if isinstance(target_url, str) else None
+    if base_headers is None:
+        return _cors_response(Response(_INVALID_TARGET_BODY, status=400, mimetype='text/plain'))
 
-    headers = {{'Content-Type': 'application/json'}}
-    for header_name in ('Authorization', 'X-Domino-Api-Key'):
+    forwarded = {{}}
+    for header_name in _FORWARDED_HEADERS:
         header_value = request.headers.get(header_name)
         if header_value:
-            headers[header_name] = header_value
-
-    cookie_header = request.headers.get('Cookie')
-    if cookie_header:
-        headers['Cookie'] = cookie_header
+            forwarded[header_name] = header_value
+    headers = base_headers | forwarded
 
+    if payload is None:
+        # No payload means no request body, as requests.post(json=None) sent
+        payload_bytes = None
+        key_bytes = b''
+    else:
+        # Forwarded in the caller's key order; keys are sorted only to normalize the cache key
+        payload_bytes = orjson.dumps(payload)
+        key_bytes = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    cache_key = (target_url, hashlib.blake2b(key_bytes, digest_size=16).hexdigest())
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        headers['If-None-Match'] = cached.etag
+
+    upstream_request = CLIENT.build_request('POST', target_url, headers=headers, content=payload_bytes)
     try:
-        upstream = requests.post(target_url, headers=headers, json=payload, timeout=30)
-    except requests.RequestException as exc:
+        upstream = CLIENT.send(upstream_request, stream=True)
+    except httpx.HTTPError as exc:
         return _cors_response(Response(f"Upstream request failed: {{exc}}", status=502))
 
-    response = Response(
-        upstream.content,
-        status=upstream.status_code,
-        mimetype=upstream.headers.get('Content-Type', 'application/json'),
-    )
+    if upstream.status_code == 304 and cached is not None:
+        upstream.close()
+        return _cors_response(Response(cached.body, mimetype=cached.mimetype))
+
+    # Pass the upstream body through in chunks rather than buffering it whole
+    mimetype = upstream.headers.get('Content-Type', 'application/json')
+    etag = upstream.headers.get('ETag')
+    if upstream.status_code == 200 and etag:
+        body = _stream_and_cache(upstream, cache_key, etag, mimetype)
+    else:
+        body = upstream.iter_bytes(UPSTREAM_CHUNK_SIZE)
+    response = Response(body, status=upstream.status_code, mimetype=mimetype, direct_passthrough=True)
+    response.call_on_close(upstream.close)
     return _cors_response(response)
 
+# The health payload never changes after import, so one Response serves every probe
+_HEALTH_RESP = Response(
+    orjson.dumps({{"status": "ok", "files": list(FILES)}}),
+    mimetype='application/json',
+    headers={{'Cache-Control': 'no-cache'}},
+)
+
 @app.route('/health', methods=['GET'])
 def health():
     """Health check endpoint."""
-    return {{"status": "ok", "files": list(FILES.keys())}}
+    return _HEALTH_RESP
+
+def dump_static(directory):
+    """Copy every precomputed file variant into directory for a fronting web server."""
+    os.makedirs(directory, exist_ok=True)
+    for asset in FILES.values():
+        for path in (asset.path, asset.gzip_path, asset.br_path):
+            if path is not None:
+                shutil.copy(path, directory)
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=8888)
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Office Add-in file server and Domino proxy')
+    parser.add_argument('--dump-static', metavar='DIR', help='write the add-in files to DIR (for Nginx) and exit')
+    args = parser.parse_args()
+
+    if args.dump_static:
+        dump_static(args.dump_static)
+    else:
+        # Development server; production launches exec gunicorn before the assets are built,
+        # and only reach here when gunicorn could not be started
+        app.run(host='0.0.0.0', port=8888)
 '''
     return model_py
 
 
+def generate_server_deploy_files(port: int = 8888) -> dict[str, str]:
+    """
+    Generate the WSGI entry point and gunicorn settings for the add-in server.
+
+    Returns dict mapping filename -> content, written next to model.py.
+    """
+    wsgi_py = '''"""WSGI entry point for the Office Add-in server."""
+
+from model import app
+'''
+
+    gunicorn_conf = f'''"""
+Gunicorn settings for the Office Add-in server.
+
+Run with: gunicorn -c gunicorn_conf.py wsgi:app
+
+uWSGI alternative:
+    uwsgi --http :{port} --module wsgi:app --master --processes 4 --threads 16
+"""
+
+import os
+
+bind = "0.0.0.0:{port}"
+# os.cpu_count() reports the host's cores, not the container's CPU quota, and every
+# worker holds its own upstream client and caches; size the pool explicitly instead
+workers = int(os.environ.get("WEB_CONCURRENCY", "2"))
+worker_class = "gthread"
+threads = 16
+keepalive = 75
+# Import model.py once in the master so the add-in files are encoded and
+# written to disk a single time, then shared by every forked worker
+preload_app = True
+'''
+
+    return {"wsgi.py": wsgi_py, "gunicorn_conf.py": gunicorn_conf}
+
+
+def generate_nginx_config(static_root: str, flask_port: int = 8888) -> str:
+    """
+    Generate an Nginx server block that serves the add-in files directly.
+
+    Only /proxy and /health (and unknown files) reach Flask; the static root is
+    populated with `python model.py --dump-static <static_root>`.
+    """
+    return f'''# Office Add-in static files served by Nginx; Flask handles /proxy and /health.
+# Populate the root with: python model.py --dump-static {static_root}
+server {{
+    listen 80;
+
+    root {static_root};
+    gzip_static on;
+
+    # Add-in files are requested as /?file=<name>
+    location = / {{
+        set $addin_file $arg_file;
+        if ($addin_file = "") {{
+            set $addin_file index.html;
+        }}
+        if ($addin_file !~ "^[A-Za-z0-9._-]+$") {{
+            return 404;
+        }}
+        # Same CORS headers Flask's _cors_response attaches, so cross-origin loads behave alike
+        set $cors_origin $http_origin;
+        if ($cors_origin = "") {{
+            set $cors_origin "*";
+        }}
+        add_header Access-Control-Allow-Origin $cors_origin always;
+        add_header Access-Control-Allow-Credentials "true" always;
+        add_header Access-Control-Allow-Methods "GET, POST, OPTIONS" always;
+        add_header Access-Control-Allow-Headers "Content-Type, Authorization, X-Domino-Api-Key" always;
+        add_header Cache-Control "public, max-age=3600";
+        try_files /$addin_file @flask;
+    }}
+
+    location /proxy {{
+        proxy_pass http://127.0.0.1:{flask_port};
+        proxy_set_header Host $host;
+        proxy_http_version 1.1;
+        proxy_set_header Connection "";
+    }}
+
+    location /health {{
+        proxy_pass http://127.0.0.1:{flask_port};
+    }}
+
+    location @flask {{
+        proxy_pass http://127.0.0.1:{flask_port};
+    }}
+}}
+'''
+
+
 def update_manifest_urls(manifest_content: str, hosted_url: str) -> str:
     """Update placeholder URLs in manifest with actual hosted URL."""
     return manifest_content.replace("{{HOSTED_URL}}", hosted_url)
@@ -1792,6 +2284,9 @@ def build_addin(endpoints: list[EndpointConfig]) -> str | None:
   <ItemGroup>
     <PackageReference Include="ExcelDna.AddIn" Version="1.7.0" />
   </ItemGroup>
+  <ItemGroup>
+    <Reference Include="System.Net.Http" />
+  </ItemGroup>
 </Project>
 '''
         csproj_file = os.path.join(build_dir, "DominoModelFunctions.csproj")
@@ -1803,8 +2298,11 @@ def build_addin(endpoints: list[EndpointConfig]) -> str | None:
         print("[5/6] Building add-in (this may take a moment)...")
 
         # Restore packages
+        restore_cmd = ["dotnet", "restore"]
+        if NUGET_PACKAGES_DIR:
+            restore_cmd += ["--packages", NUGET_PACKAGES_DIR]
         result = subprocess.run(
-            ["dotnet", "restore"],
+            restore_cmd,
             cwd=build_dir,
             capture_output=True,
             text=True
@@ -1814,9 +2312,9 @@ def build_addin(endpoints: list[EndpointConfig]) -> str | None:
             print(f"       Restore errors: {result.stderr}")
             raise RuntimeError(f"dotnet restore failed: {result.stderr}")
 
-        # Build the project
+        # Build the project (already restored above)
         result = subprocess.run(
-            ["dotnet", "build", "-c", "Release"],
+            ["dotnet", "build", "-c", "Release", "--no-restore"],
             cwd=build_dir,
             capture_output=True,
             text=True
@@ -2029,10 +2527,22 @@ def main():
             f.write(server_code)
         print(f"  Generated Flask server: model.py")
 
+        # Nginx config for serving the static files without Flask
+        nginx_path = os.path.join(output_dir, "nginx.conf")
+        with open(nginx_path, "w", encoding="utf-8") as f:
+            f.write(generate_nginx_config("/srv/office_addin"))
+        print(f"  Generated Nginx config: nginx.conf")
+
+        # Write the gunicorn entry point and settings
+        for filename, content in generate_server_deploy_files().items():
+            with open(os.path.join(output_dir, filename), "w", encoding="utf-8") as f:
+                f.write(content)
+        print(f"  Generated gunicorn entry point: wsgi.py, gunicorn_conf.py")
+
         # Write requirements.txt
         requirements_path = os.path.join(output_dir, "requirements.txt")
         with open(requirements_path, "w") as f:
-            f.write("flask>=2.0.0\nrequests>=2.0.0\n")
+            f.write("flask>=2.0.0\nhttpx[http2]>=0.24.0\norjson>=3.0.0\ngunicorn>=21.0.0\n")
         print(f"  Generated requirements.txt")
 
         # Copy manifest to artifacts
@@ -2067,15 +2577,21 @@ def main():
         print()
         print("OPTION 1: Manual Hosting")
         print(f"  1. Deploy the Flask app in {output_dir} to a web server")
+        print("     (FLASK_ENV=development python model.py runs the dev server)")
         print("  2. Update the manifest.xml with the actual hosted URL")
         print("  3. Load the manifest in Excel (see instructions below)")
         print()
         print("OPTION 2: Deploy as Domino App")
         print(f"  1. Create a new Domino App from the files in {output_dir}")
-        print("  2. Set the app to run: python model.py")
+        print("  2. Set the app to run: python model.py (starts gunicorn)")
         print("  3. Once deployed, update manifest.xml with the app URL")
         print("  4. Load the updated manifest in Excel")
         print()
+        print("OPTION 3: Nginx in front of Flask")
+        print("  1. Run: python model.py --dump-static /srv/office_addin")
+        print(f"  2. Include {nginx_path} in your Nginx config")
+        print("  3. Run the server for /proxy and /health: python model.py")
+        print()
         print("=" * 60)
         print("Loading the Add-in in Excel")
         print("=" * 60)
@@ -1,6 +1,7 @@
 import hashlib
 import io
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Tuple
 
 import mlflow.pyfunc
 import numpy as np
@@ -18,66 +19,82 @@ TENORS = [
 
 RATINGS = ["AAA", "AA", "A", "BBB", "BB", "B"]
 
+TENOR_NAMES = [tenor for tenor, _ in TENORS]
+TENOR_YEARS = np.array([years for _, years in TENORS], dtype=float)
+# Shared by every cached curve as its "years" column, so it is read-only from the start
+TENOR_YEARS.flags.writeable = False
+
+BASE_CURVE_YEARS = np.array([0.25, 1, 2, 3, 5, 7, 10], dtype=float)
+BASE_CURVE_RATES = np.array([0.0365, 0.0347, 0.0347, 0.0355, 0.0374, 0.0395, 0.0419])
+
+BASE_SPREADS = {
+    "AAA": 0.0050,
+    "AA": 0.0080,
+    "A": 0.0120,
+    "BBB": 0.0180,
+    "BB": 0.0350,
+    "B": 0.0550,
+}
+
+TERM_WIDEN = {
+    "AAA": 0.0003,
+    "AA": 0.0004,
+    "A": 0.0006,
+    "BBB": 0.0009,
+    "BB": 0.0012,
+    "B": 0.0018,
+}
+
+
+def _hash16(key: str) -> int:
+    # Leading 16 bits of the MD5 digest, read from the raw bytes rather than a hex string.
+    # Kept on MD5 so existing curve dates keep producing the same published curves.
+    return int.from_bytes(hashlib.md5(key.encode("utf-8")).digest()[:2], "big")
+
 
 def _date_tweak(curve_date: str) -> float:
-    digest = hashlib.md5(curve_date.encode("utf-8")).hexdigest()
-    basis_points = (int(digest[:4], 16) % 41) - 20
+    basis_points = (_hash16(curve_date) % 41) - 20
     return basis_points / 10_000.0
 
 
-def _risk_free_rate(years: float, tweak: float) -> float:
-    base_years = np.array([0.25, 1, 2, 3, 5, 7, 10], dtype=float)
-    base_rates = np.array([0.0365, 0.0347, 0.0347, 0.0355, 0.0374, 0.0395, 0.0419])
-    rate = float(np.interp(years, base_years, base_rates))
-    return max(rate + tweak, 0.001)
+def _risk_free_rates(years: np.ndarray) -> np.ndarray:
+    return np.interp(years, BASE_CURVE_YEARS, BASE_CURVE_RATES)
 
 
 def _spread_tweak(curve_date: str, rating: str) -> float:
-    digest = hashlib.md5(f"{curve_date}:{rating}".encode("utf-8")).hexdigest()
-    basis_points = (int(digest[:4], 16) % 21) - 10
+    basis_points = (_hash16(f"{curve_date}:{rating}") % 21) - 10
     return basis_points / 10_000.0
 
 
-def _spreads(years: float, curve_date: str) -> Dict[str, float]:
-    base = {
-        "AAA": 0.0050,
-        "AA": 0.0080,
-        "A": 0.0120,
-        "BBB": 0.0180,
-        "BB": 0.0350,
-        "B": 0.0550,
-    }
-    term_widen = {
-        "AAA": 0.0003,
-        "AA": 0.0004,
-        "A": 0.0006,
-        "BBB": 0.0009,
-        "BB": 0.0012,
-        "B": 0.0018,
-    }
+def _spread_table(years: np.ndarray, curve_date: str) -> Dict[str, np.ndarray]:
     return {
-        rating: base[rating] + term_widen[rating] * years + _spread_tweak(curve_date, rating)
+        rating: BASE_SPREADS[rating] + TERM_WIDEN[rating] * years + _spread_tweak(curve_date, rating)
         for rating in RATINGS
     }
 
 
+@lru_cache(maxsize=128)
+def _curve_columns(curve_date: str) -> Tuple[Tuple[str, np.ndarray], ...]:
+    tweak = _date_tweak(curve_date)
+    rf_rates = np.maximum(_risk_free_rates(TENOR_YEARS) + tweak, 0.001)
+    discount_factors = np.exp(-rf_rates * TENOR_YEARS)
+    data = {
+        "tenor": TENOR_NAMES,
+        "years": TENOR_YEARS,
+        "risk_free_rate": rf_rates.round(6),
+        "discount_factor": discount_factors.round(6),
+    }
+    for rating, spreads in _spread_table(TENOR_YEARS, curve_date).items():
+        data[f"spread_{rating}"] = spreads.round(6)
+    for values in data.values():
+        if isinstance(values, np.ndarray):
+            values.flags.writeable = False
+    return tuple(data.items())
+
+
 def build_credit_curve(curve_date: str) -> pd.DataFrame:
-    tweak = _date_tweak(str(curve_date))
-    rows = []
-    for tenor, years in TENORS:
-        rf_rate = _risk_free_rate(years, tweak)
-        discount_factor = float(np.exp(-rf_rate * years))
-        spreads = _spreads(years, curve_date)
-        row = {
-            "tenor": tenor,
-            "years": years,
-            "risk_free_rate": round(rf_rate, 6),
-            "discount_factor": round(discount_factor, 6),
-        }
-        for rating in RATINGS:
-            row[f"spread_{rating}"] = round(spreads[rating], 6)
-        rows.append(row)
-    return pd.DataFrame(rows)
+    # Curves are cached per date; each caller gets its own frame built from the cached columns
+    return pd.DataFrame(dict(_curve_columns(str(curve_date))))
 
 
 def curve_to_json(curve_df: pd.DataFrame) -> str:
@@ -1,12 +1,17 @@
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 import json
+import logging
 
 import mlflow.pyfunc
 import numpy as np
 import pandas as pd
 
-from credit_curve_model import RATINGS, _spreads
+from credit_curve_model import _spread_table
+
+# Diagnostics are debug-level so a serving process does not format and write them per request
+logger = logging.getLogger(__name__)
 
 REQUIRED_COLS = [
     "loan_id",
@@ -35,6 +40,8 @@ RISK_WEIGHTS = {
     "BB": 1.50,
     "B": 2.00,
 }
+# Lets a whole batch of ratings be mapped to weights in one vectorized lookup
+_RISK_WEIGHT_SERIES = pd.Series(RISK_WEIGHTS)
 
 PD_RATING_THRESHOLDS = [
     (0.0004, "AAA"),
@@ -45,28 +52,28 @@ PD_RATING_THRESHOLDS = [
 ]
 
 
-def _derive_credit_rating(pd_1y: float) -> str:
-    """Map 1-year PD to an implied credit rating."""
-    for threshold, rating in PD_RATING_THRESHOLDS:
-        if pd_1y < threshold:
-            return rating
-    return "B"
+def _derive_credit_ratings(pd_1y: np.ndarray) -> np.ndarray:
+    """Map 1-year PDs to implied credit ratings."""
+    conditions = [pd_1y < threshold for threshold, _ in PD_RATING_THRESHOLDS]
+    choices = [rating for _, rating in PD_RATING_THRESHOLDS]
+    return np.select(conditions, choices, default="B")
 
 
-def _derive_lgd(pd_1y: float, pd_5y: float, pd_maturity: float) -> float:
-    """Derive implied LGD from PD term structure.
+def _derive_lgds(pd_1y: np.ndarray, pd_5y: np.ndarray, pd_maturity: np.ndarray) -> np.ndarray:
+    """Derive implied LGDs from the PD term structure.
 
     Base component from maturity PD level; steepness adjustment
     from the 5Y/1Y PD ratio.
     """
     base_lgd = 0.25 + 0.5 * pd_maturity
-    if pd_1y > 1e-6:
-        steepness_ratio = pd_5y / pd_1y
-        steepness_adj = 0.02 * max(0.0, steepness_ratio - 4.0)
-    else:
-        steepness_adj = 0.0
+    has_pd_1y = pd_1y > 1e-6
+    steepness_ratio = np.divide(pd_5y, pd_1y, out=np.zeros_like(base_lgd), where=has_pd_1y)
+    excess_steepness = steepness_ratio - 4.0
+    steepness_adj = np.where(has_pd_1y & (excess_steepness > 0.0), 0.02 * excess_steepness, 0.0)
     lgd = base_lgd + steepness_adj
-    return max(0.10, min(0.75, lgd))
+    # Written as comparisons rather than np.clip so a NaN falls to the bound, as min/max did
+    lgd = np.where(lgd < 0.75, lgd, 0.75)
+    return np.where(lgd > 0.10, lgd, 0.10)
 
 
 def _ensure_columns(model_input: pd.DataFrame, columns: List[str]) -> None:
@@ -77,11 +84,16 @@ def _ensure_columns(model_input: pd.DataFrame, columns: List[str]) -> None:
 
 
 def _coerce_numeric(model_input: pd.DataFrame, columns: List[str]) -> None:
+    debug = logger.isEnabledFor(logging.DEBUG)
     for col in columns:
-        before_na = int(model_input[col].isna().sum()) if col in model_input.columns else -1
-        model_input[col] = pd.to_numeric(model_input[col], errors="coerce")
-        after_na = int(model_input[col].isna().sum())
-        print(f"[ExpectedLossModel] Coerce numeric '{col}': NaN before={before_na} after={after_na}")
+        if debug:
+            before_na = int(model_input[col].isna().sum()) if col in model_input.columns else -1
+        # Typed inputs (the usual MLflow serving case) are already numeric; only parse text columns
+        if not pd.api.types.is_numeric_dtype(model_input[col]):
+            model_input[col] = pd.to_numeric(model_input[col], errors="coerce")
+        if debug:
+            after_na = int(model_input[col].isna().sum())
+            logger.debug("Coerce numeric '%s': NaN before=%d after=%d", col, before_na, after_na)
 
 
 def _apply_aliases(model_input: pd.DataFrame) -> pd.DataFrame:
@@ -91,45 +103,72 @@ def _apply_aliases(model_input: pd.DataFrame) -> pd.DataFrame:
             rename_map[old] = new
     if not rename_map:
         return model_input
-    print(f"[ExpectedLossModel] Applying aliases: {rename_map}")
+    logger.debug("Applying aliases: %s", rename_map)
     return model_input.rename(columns=rename_map)
 
 
-def get_risky_discount_factor(
+def _interp_weights(x: np.ndarray, xp: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bracketing indices and weights for linear interpolation of x on sorted xp.
+
+    Computed once and reused for every series on the same grid; weights are
+    clamped so points outside the grid take the end values, as np.interp does.
+    """
+    hi = np.searchsorted(xp, x, side="right").clip(1, max(len(xp) - 1, 1))
+    lo = hi - 1
+    hi = np.minimum(hi, len(xp) - 1)
+    width = xp[hi] - xp[lo]
+    t = np.divide(x - xp[lo], width, out=np.zeros_like(x), where=width > 0)
+    return lo, hi, np.clip(t, 0.0, 1.0)
+
+
+def _lerp(ys: np.ndarray, lo: np.ndarray, hi: np.ndarray, t: np.ndarray) -> np.ndarray:
+    return ys[lo] + t * (ys[hi] - ys[lo])
+
+
+def get_risky_discount_factors(
     curve_df: pd.DataFrame,
-    rating: str,
-    years: float,
-) -> float:
-    spread_col = f"spread_{rating}"
-    if spread_col not in curve_df.columns:
-        raise ValueError(f"Unsupported rating: {rating}")
-    rf_rate = float(np.interp(years, curve_df["years"], curve_df["risk_free_rate"]))
-    spread = float(np.interp(years, curve_df["years"], curve_df[spread_col]))
-    risky_rate = rf_rate + spread
-    return float(np.exp(-risky_rate * years))
-
-
-def compute_expected_loss(
-    row: pd.Series,
+    ratings: np.ndarray,
+    years: np.ndarray,
+) -> np.ndarray:
+    curve_years = curve_df["years"].to_numpy()
+    # Loan books repeat a handful of terms; locate each distinct term on the curve once
+    term_grid, term_index = np.unique(years, return_inverse=True)
+    lo, hi, t = _interp_weights(term_grid, curve_years)
+    rf_rates = _lerp(curve_df["risk_free_rate"].to_numpy(), lo, hi, t)
+    rating_grid, rating_index = np.unique(ratings, return_inverse=True)
+    spread_cols = [f"spread_{rating}" for rating in rating_grid]
+    for rating, spread_col in zip(rating_grid, spread_cols):
+        if spread_col not in curve_df.columns:
+            raise ValueError(f"Unsupported rating: {rating}")
+    # One (rating, term) table of discount factors; each loan picks its cell
+    spread_curves = curve_df[spread_cols].to_numpy().T
+    spreads = spread_curves[:, lo] + t * (spread_curves[:, hi] - spread_curves[:, lo])
+    risky_rates = rf_rates + spreads
+    return np.exp(-risky_rates * term_grid)[rating_index, term_index]
+
+
+def compute_expected_losses(
+    model_input: pd.DataFrame,
     curve_df: pd.DataFrame,
-    implied_rating: str,
-    implied_lgd: float,
-) -> Tuple[float, float, float]:
-    pd_maturity = row["probability_of_default_maturity"]
-    ead = row["exposure_at_default"]
-    remaining_years = row["remaining_term_years"]
-
-    el_undisc = pd_maturity * implied_lgd * ead
-    df = get_risky_discount_factor(curve_df, implied_rating, remaining_years)
+    implied_ratings: np.ndarray,
+    implied_lgds: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    pd_maturity = model_input["probability_of_default_maturity"].to_numpy(dtype=float)
+    ead = model_input["exposure_at_default"].to_numpy(dtype=float)
+    remaining_years = model_input["remaining_term_years"].to_numpy(dtype=float)
+
+    el_undisc = pd_maturity * implied_lgds * ead
+    df = get_risky_discount_factors(curve_df, implied_ratings, remaining_years)
     el_disc = el_undisc * df
-    rwa = ead * RISK_WEIGHTS.get(implied_rating, 1.0)
-    if not np.isfinite([el_undisc, el_disc, rwa]).all():
+    risk_weights = _RISK_WEIGHT_SERIES.reindex(implied_ratings).fillna(1.0).to_numpy()
+    rwa = ead * risk_weights
+    if not (np.isfinite(el_undisc).all() and np.isfinite(el_disc).all() and np.isfinite(rwa).all()):
         raise ValueError("Computed values contain NaN or Inf")
-    return float(el_undisc), float(el_disc), float(rwa)
+    return el_undisc, el_disc, rwa
 
 
 def _coerce_curve_array(value, label: str) -> np.ndarray:
-    print(f"[ExpectedLossModel] Raw {label} type={type(value).__name__} value={value}")
+    logger.debug("Raw %s type=%s value=%s", label, type(value).__name__, value)
     if isinstance(value, str):
         try:
             value = json.loads(value)
@@ -138,30 +177,69 @@ def _coerce_curve_array(value, label: str) -> np.ndarray:
     if value is None:
         raise ValueError(f"Missing {label}")
     arr = np.asarray(value, dtype=float)
-    print(f"[ExpectedLossModel] Coerced {label} dtype={arr.dtype} shape={arr.shape} sample={arr[:5] if arr.size else arr}")
+    logger.debug("Coerced %s dtype=%s shape=%s sample=%s", label, arr.dtype, arr.shape, arr[:5])
     if not np.isfinite(arr).all():
         raise ValueError(f"Invalid {label}: contains NaN or Inf")
     return arr
 
 
-def _curve_from_arrays(curve_tenors, curve_rates) -> pd.DataFrame:
+def _curve_columns(curve_tenors, curve_rates) -> Dict[str, np.ndarray]:
     tenors = _coerce_curve_array(curve_tenors, "curve_tenors")
     rates = _coerce_curve_array(curve_rates, "curve_rates")
     if tenors.shape != rates.shape:
         raise ValueError("curve_tenors and curve_rates must have matching lengths")
+    # Sort the input arrays up front rather than sorting (and copying) the finished frame
+    order = np.argsort(tenors)
+    tenors = tenors[order]
+    rates = rates[order]
     curve_date = "static"
     data = {"years": tenors, "risk_free_rate": rates}
-    for rating in RATINGS:
-        data[f"spread_{rating}"] = [
-            _spreads(float(years), curve_date)[rating] for years in tenors
-        ]
-    return pd.DataFrame(data).sort_values("years")
+    # Every rating's spread curve over all tenors in one pass; the tweak is hashed once per rating
+    for rating, spreads in _spread_table(tenors, curve_date).items():
+        data[f"spread_{rating}"] = spreads
+    return data
+
+
+def _curve_from_arrays(curve_tenors, curve_rates) -> pd.DataFrame:
+    return pd.DataFrame(_curve_columns(curve_tenors, curve_rates))
+
+
+def _curve_cache_key(value):
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+    if isinstance(value, list):
+        value = tuple(value)
+    try:
+        hash(value)
+    except TypeError:
+        return None
+    return value
+
+
+@lru_cache(maxsize=8)
+def _cached_curve_columns(curve_tenors, curve_rates) -> Tuple[Tuple[str, np.ndarray], ...]:
+    data = _curve_columns(curve_tenors, curve_rates)
+    for values in data.values():
+        values.flags.writeable = False
+    return tuple(data.items())
+
+
+def _load_curve(curve_tenors, curve_rates) -> pd.DataFrame:
+    """Build the curve frame, reusing the parsed columns when the same curve is sent with successive batches."""
+    tenors_key = _curve_cache_key(curve_tenors)
+    rates_key = _curve_cache_key(curve_rates)
+    if tenors_key is None or rates_key is None:
+        return _curve_from_arrays(curve_tenors, curve_rates)
+    # Each call gets its own frame built from the cached, read-only columns
+    return pd.DataFrame(dict(_cached_curve_columns(tenors_key, rates_key)))
 
 
 class ExpectedLossModel(mlflow.pyfunc.PythonModel):
     def predict(self, context, model_input: pd.DataFrame) -> pd.DataFrame:
-        print(f"[ExpectedLossModel] Input columns: {list(model_input.columns)} rows={len(model_input)}")
-        print(f"[ExpectedLossModel] Input head:\n{model_input.head(3)}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Input columns: %s rows=%d", list(model_input.columns), len(model_input))
+            logger.debug("Input head:\n%s", model_input.head(3))
         model_input = _apply_aliases(model_input)
         _ensure_columns(model_input, REQUIRED_COLS)
         _coerce_numeric(
@@ -177,30 +255,42 @@ class ExpectedLossModel(mlflow.pyfunc.PythonModel):
 
         curve_tenors = model_input["curve_tenors"].iloc[0]
         curve_rates = model_input["curve_rates"].iloc[0]
-        curve_df = _curve_from_arrays(curve_tenors, curve_rates)
-        print(f"[ExpectedLossModel] Curve df head:\n{curve_df.head(3)}")
-
-        results = []
-        for _, row in model_input.iterrows():
-            implied_rating = _derive_credit_rating(row["probability_of_default_1y"])
-            implied_lgd = _derive_lgd(
-                row["probability_of_default_1y"],
-                row["probability_of_default_5y"],
-                row["probability_of_default_maturity"],
-            )
-            print(f"[ExpectedLossModel] Row loan_id={row['loan_id']} implied_rating={implied_rating} implied_lgd={implied_lgd:.4f} term={row['remaining_term_years']}")
-            el_u, el_d, rwa = compute_expected_loss(row, curve_df, implied_rating, implied_lgd)
-            results.append(
-                {
-                    "loan_id": row["loan_id"],
-                    "implied_credit_rating": implied_rating,
-                    "implied_lgd": round(implied_lgd, 4),
-                    "el_undiscounted": el_u,
-                    "el_discounted": el_d,
-                    "rwa": rwa,
-                }
-            )
-
-        output = pd.DataFrame(results)
-        print(f"[ExpectedLossModel] Output head:\n{output.head(3)}")
+        curve_df = _load_curve(curve_tenors, curve_rates)
+        if debug:
+            logger.debug("Curve df head:\n%s", curve_df.head(3))
+
+        pd_1y = model_input["probability_of_default_1y"].to_numpy(dtype=float)
+        implied_ratings = _derive_credit_ratings(pd_1y)
+        implied_lgds = _derive_lgds(
+            pd_1y,
+            model_input["probability_of_default_5y"].to_numpy(dtype=float),
+            model_input["probability_of_default_maturity"].to_numpy(dtype=float),
+        )
+        if debug:
+            # Iterate plain Python lists rather than boxing a numpy/pandas scalar per element
+            for loan_id, implied_rating, implied_lgd, term in zip(
+                model_input["loan_id"].tolist(),
+                implied_ratings.tolist(),
+                implied_lgds.tolist(),
+                model_input["remaining_term_years"].tolist(),
+            ):
+                logger.debug(
+                    "Row loan_id=%s implied_rating=%s implied_lgd=%.4f term=%s",
+                    loan_id, implied_rating, implied_lgd, term,
+                )
+        el_u, el_d, rwa = compute_expected_losses(model_input, curve_df, implied_ratings, implied_lgds)
+
+        output = pd.DataFrame(
+            {
+                "loan_id": model_input["loan_id"].to_numpy(),
+                "implied_credit_rating": implied_ratings,
+                "implied_lgd": np.round(implied_lgds, 4),
+                "el_undiscounted": el_u,
+                "el_discounted": el_d,
+                "rwa": rwa,
+            },
+            copy=False,
+        )
+        if debug:
+            logger.debug("Output head:\n%s", output.head(3))
         return output
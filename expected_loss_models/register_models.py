@@ -1,6 +1,9 @@
 import base64
 import hashlib
+import importlib.metadata
+import json
 import os
+import platform
 import re
 import uuid
 
@@ -12,6 +15,12 @@ import requests
 from mlflow.models import infer_signature
 from mlflow.models.signature import ModelSignature
 from mlflow.types.schema import Array, ColSpec, Schema
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from credit_curve_model import CreditCurveModel, build_credit_curve
 from expected_loss_model import ExpectedLossModel
@@ -26,6 +35,16 @@ CODE_PATHS = [
     os.path.join(BASE_DIR, "loan_inventory_model.py"),
     os.path.join(BASE_DIR, "loan_pd_model.py"),
 ]
+FINGERPRINT_TAG = "model_fingerprint"
+# Packages whose installed versions log_model pins into the logged environment.
+FINGERPRINT_PACKAGES = ("pandas", "numpy", "xgboost")
+# Fields copied from an existing model API into its metadata update when present.
+CARRIED_API_FIELDS = ("hardwareTierId", "resourceQuotaId")
+
+# Model API registration makes several calls per model to the same Domino host;
+# a shared session keeps those on one pooled keep-alive connection.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
 
 
 def _curve_examples():
@@ -158,6 +177,90 @@ def resolve_registered_model_version(model_name: str, model_info: object) -> int
     return None
 
 
+def _environment_requirements() -> list[str]:
+    # log_model resolves and pins these at log time, so an upgrade must yield a new version
+    requirements = list(mlflow.pyfunc.get_default_pip_requirements())
+    requirements.append(f"mlflow=={mlflow.__version__}")
+    for package in FINGERPRINT_PACKAGES:
+        try:
+            requirements.append(f"{package}=={importlib.metadata.version(package)}")
+        except importlib.metadata.PackageNotFoundError:
+            requirements.append(f"{package}==")
+    requirements.append(f"python=={platform.python_version()}")
+    return requirements
+
+
+def model_fingerprint(signature: ModelSignature, artifacts: dict[str, str] | None = None) -> str:
+    digest = hashlib.sha256()
+    for path in CODE_PATHS + sorted((artifacts or {}).values()):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    digest.update(json.dumps(signature.to_dict(), sort_keys=True, separators=(",", ":")).encode())
+    digest.update("\n".join(_environment_requirements()).encode())
+    return digest.hexdigest()
+
+
+def find_matching_model_version(model_name: str, fingerprint: str) -> int | None:
+    try:
+        client = mlflow.tracking.MlflowClient()
+        versions = client.search_model_versions(f"name='{model_name}'")
+    except mlflow.exceptions.MlflowException:
+        return None
+    matches = [int(v.version) for v in versions if (v.tags or {}).get(FINGERPRINT_TAG) == fingerprint]
+    return max(matches) if matches else None
+
+
+def log_model_if_changed(
+    model_name: str,
+    python_model: mlflow.pyfunc.PythonModel,
+    signature: ModelSignature,
+    input_example: pd.DataFrame,
+    params: dict,
+    metrics: dict | None = None,
+    artifacts: dict[str, str] | None = None,
+) -> int | None:
+    fingerprint = model_fingerprint(signature, artifacts)
+    version = find_matching_model_version(model_name, fingerprint)
+    if version is not None:
+        print(f"{model_name} unchanged since version {version}; skipping log_model.")
+        return version
+
+    mlflow.set_experiment(_experiment_name(model_name))
+    with mlflow.start_run():
+        mlflow.log_params(params)
+        if metrics is not None:
+            mlflow.log_metrics(metrics)
+        model_info = mlflow.pyfunc.log_model(
+            name=model_name,
+            python_model=python_model,
+            artifacts=artifacts,
+            signature=signature,
+            input_example=input_example,
+            code_paths=CODE_PATHS,
+            registered_model_name=model_name,
+        )
+
+    version = resolve_registered_model_version(model_name, model_info)
+    if version is not None:
+        try:
+            mlflow.tracking.MlflowClient().set_model_version_tag(
+                model_name, str(version), FINGERPRINT_TAG, fingerprint
+            )
+        except mlflow.exceptions.MlflowException:
+            pass
+    return version
+
+
+def _response_json(response: requests.Response):
+    # Decode the raw bytes directly; response.json() goes through response.text,
+    # which may run charset detection over the whole body first.
+    loads = orjson.loads if orjson is not None else json.loads
+    try:
+        return loads(response.content)
+    except json.JSONDecodeError as exc:
+        raise requests.JSONDecodeError(exc.msg, exc.doc, exc.pos) from exc
+
+
 def resolve_domino_url() -> tuple[str, str]:
     domino_url = os.environ.get("DOMINO_URL", "").strip()
     if domino_url:
@@ -180,7 +283,7 @@ def resolve_environment_id(
     if project_id:
         headers = {"X-Domino-Api-Key": api_key}
         try:
-            response = requests.get(
+            response = SESSION.get(
                 f"{domino_url}/v4/projects/{project_id}/settings",
                 headers=headers,
                 timeout=30,
@@ -192,7 +295,7 @@ def resolve_environment_id(
             content_type = response.headers.get("content-type", "")
             if "application/json" in content_type:
                 try:
-                    payload = response.json()
+                    payload = _response_json(response)
                 except requests.JSONDecodeError:
                     payload = None
                 if isinstance(payload, dict):
@@ -203,7 +306,7 @@ def resolve_environment_id(
     env_name = os.environ.get("DOMINO_ENVIRONMENT_NAME", "")
     headers = {"X-Domino-Api-Key": api_key}
     try:
-        response = requests.get(
+        response = SESSION.get(
             f"{domino_url}/api/environments/beta/environments",
             params={"limit": 100},
             headers=headers,
@@ -213,7 +316,7 @@ def resolve_environment_id(
     except requests.RequestException:
         return None, "environment lookup failed"
 
-    payload = response.json()
+    payload = _response_json(response)
     environments = payload.get("environments", [])
     if env_name:
         for env in environments:
@@ -248,7 +351,7 @@ def _find_model_api_id(
     model_api_name: str,
 ) -> str | None:
     try:
-        response = requests.get(
+        response = SESSION.get(
             f"{domino_url}/api/modelServing/v1/modelApis",
             params={"projectId": project_id, "name": model_api_name},
             headers=headers,
@@ -258,7 +361,7 @@ def _find_model_api_id(
     except requests.RequestException:
         return None
 
-    payload = response.json()
+    payload = _response_json(response)
     items = payload.get("items", [])
     for item in items:
         if item.get("name") == model_api_name and not item.get("archived", False):
@@ -272,7 +375,7 @@ def _get_model_api_by_id(
     model_api_id: str,
 ) -> dict | None:
     try:
-        response = requests.get(
+        response = SESSION.get(
             f"{domino_url}/api/modelServing/v1/modelApis/{model_api_id}",
             headers=headers,
             timeout=30,
@@ -280,7 +383,7 @@ def _get_model_api_by_id(
         response.raise_for_status()
     except requests.RequestException:
         return None
-    payload = response.json()
+    payload = _response_json(response)
     return payload if isinstance(payload, dict) else None
 
 
@@ -365,12 +468,11 @@ def register_model_api_endpoint(
             "environmentId": resolved_environment_id,
             "replicas": existing_api.get("replicas", 1),
         }
-        if "hardwareTierId" in existing_api:
-            update_payload["hardwareTierId"] = existing_api.get("hardwareTierId")
-        if "resourceQuotaId" in existing_api:
-            update_payload["resourceQuotaId"] = existing_api.get("resourceQuotaId")
+        update_payload.update(
+            (key, existing_api[key]) for key in CARRIED_API_FIELDS if key in existing_api
+        )
         try:
-            update_response = requests.put(
+            update_response = SESSION.put(
                 f"{domino_url}/api/modelServing/v1/modelApis/{existing_id}",
                 json=update_payload,
                 headers=headers,
@@ -389,14 +491,14 @@ def register_model_api_endpoint(
         version_payload["projectId"] = project_id
         version_payload["environmentId"] = resolved_environment_id
         try:
-            response = requests.post(
+            response = SESSION.post(
                 f"{domino_url}/api/modelServing/v1/modelApis/{existing_id}/versions",
                 json=version_payload,
                 headers=headers,
                 timeout=30,
             )
             response.raise_for_status()
-            version_info = response.json()
+            version_info = _response_json(response)
             version_id = version_info.get("id", "unknown")
             print(
                 f"Registered model API version {version_id} for endpoint "
@@ -411,14 +513,14 @@ def register_model_api_endpoint(
         return
 
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{domino_url}/api/modelServing/v1/modelApis",
             json=payload,
             headers=headers,
             timeout=30,
         )
         response.raise_for_status()
-        model_api = response.json()
+        model_api = _response_json(response)
         model_api_id = model_api.get("id", "unknown")
         print(f"Registered model API endpoint {model_api_name} (id={model_api_id})")
     except requests.RequestException as exc:
@@ -550,65 +652,45 @@ def register_models():
         "loan_count": float(len(inventory_output)),
     }
 
-    mlflow.set_experiment(_experiment_name("GetCreditCurves"))
-    with mlflow.start_run():
-        mlflow.log_params(curve_params)
-        mlflow.log_metrics(curve_metrics)
-        curve_model_info = mlflow.pyfunc.log_model(
-            name="GetCreditCurves",
-            python_model=CreditCurveModel(),
-            signature=curve_signature,
-            input_example=curve_input,
-            code_paths=CODE_PATHS,
-            registered_model_name="GetCreditCurves",
-        )
-
-    mlflow.set_experiment(_experiment_name("GetLoanProbabilityOfDefault"))
-    with mlflow.start_run():
-        mlflow.log_params(pd_params)
-        mlflow.log_metrics(pd_metrics)
-        pd_model_info = mlflow.pyfunc.log_model(
-            name="GetLoanProbabilityOfDefault",
-            python_model=LoanPDModel(),
-            artifacts={"xgb_model": model_path},
-            signature=pd_signature,
-            input_example=pd_input_example,
-            code_paths=CODE_PATHS,
-            registered_model_name="GetLoanProbabilityOfDefault",
-        )
-
-    mlflow.set_experiment(_experiment_name("GetExpectedLoss"))
-    with mlflow.start_run():
-        mlflow.log_params(el_params)
-        mlflow.log_metrics(el_metrics)
-        el_model_info = mlflow.pyfunc.log_model(
-            name="GetExpectedLoss",
-            python_model=ExpectedLossModel(),
-            signature=el_signature,
-            input_example=el_input_example,
-            code_paths=CODE_PATHS,
-            registered_model_name="GetExpectedLoss",
-        )
-
-    mlflow.set_experiment(_experiment_name("GetLoanInventory"))
-    with mlflow.start_run():
-        mlflow.log_params(inventory_params)
-        inventory_model_info = mlflow.pyfunc.log_model(
-            name="GetLoanInventory",
-            python_model=LoanInventoryModel(),
-            signature=inventory_signature,
-            input_example=inventory_input,
-            code_paths=CODE_PATHS,
-            registered_model_name="GetLoanInventory",
-        )
+    curve_version = log_model_if_changed(
+        "GetCreditCurves",
+        CreditCurveModel(),
+        curve_signature,
+        curve_input,
+        curve_params,
+        curve_metrics,
+    )
+    pd_version = log_model_if_changed(
+        "GetLoanProbabilityOfDefault",
+        LoanPDModel(),
+        pd_signature,
+        pd_input_example,
+        pd_params,
+        pd_metrics,
+        artifacts={"xgb_model": model_path},
+    )
+    el_version = log_model_if_changed(
+        "GetExpectedLoss",
+        ExpectedLossModel(),
+        el_signature,
+        el_input_example,
+        el_params,
+        el_metrics,
+    )
+    inventory_version = log_model_if_changed(
+        "GetLoanInventory",
+        LoanInventoryModel(),
+        inventory_signature,
+        inventory_input,
+        inventory_params,
+    )
 
-    for model_name, model_info in [
-        ("GetCreditCurves", curve_model_info),
-        ("GetLoanProbabilityOfDefault", pd_model_info),
-        ("GetExpectedLoss", el_model_info),
-        ("GetLoanInventory", inventory_model_info),
+    for model_name, version in [
+        ("GetCreditCurves", curve_version),
+        ("GetLoanProbabilityOfDefault", pd_version),
+        ("GetExpectedLoss", el_version),
+        ("GetLoanInventory", inventory_version),
     ]:
-        version = resolve_registered_model_version(model_name, model_info)
         if version is None:
             print(f"Skipping model API registration for {model_name}; no version found.")
             continue
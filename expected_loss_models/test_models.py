@@ -1,9 +1,10 @@
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
-from credit_curve_model import CreditCurveModel
-from expected_loss_model import ExpectedLossModel
+from credit_curve_model import BASE_SPREADS, TERM_WIDEN, CreditCurveModel, _spread_tweak
+from expected_loss_model import PD_RATING_THRESHOLDS, RISK_WEIGHTS, ExpectedLossModel
 from loan_pd_model import LoanPDModel
 from train_pd_model import train_and_save_pd_model
 
@@ -13,6 +14,63 @@ class _DummyContext:
         self.artifacts = artifacts
 
 
+def _reference_expected_loss(row, tenors, rates):
+    """Row-at-a-time expected loss, written the way predict computed it before vectorizing."""
+    pd_1y = row["probability_of_default_1y"]
+    rating = "B"
+    for threshold, candidate in PD_RATING_THRESHOLDS:
+        if pd_1y < threshold:
+            rating = candidate
+            break
+    steepness_adj = 0.0
+    if pd_1y > 1e-6:
+        steepness_adj = 0.02 * max(0.0, row["probability_of_default_5y"] / pd_1y - 4.0)
+    lgd = max(0.10, min(0.75, 0.25 + 0.5 * row["probability_of_default_maturity"] + steepness_adj))
+
+    order = np.argsort(tenors)
+    years = np.asarray(tenors, dtype=float)[order]
+    spreads = BASE_SPREADS[rating] + TERM_WIDEN[rating] * years + _spread_tweak("static", rating)
+    term = row["remaining_term_years"]
+    rf_rate = float(np.interp(term, years, np.asarray(rates, dtype=float)[order]))
+    spread = float(np.interp(term, years, spreads))
+
+    el_undisc = row["probability_of_default_maturity"] * lgd * row["exposure_at_default"]
+    el_disc = el_undisc * np.exp(-(rf_rate + spread) * term)
+    rwa = row["exposure_at_default"] * RISK_WEIGHTS.get(rating, 1.0)
+    return rating, round(lgd, 4), el_undisc, el_disc, rwa
+
+
+def run_expected_loss_edge_cases():
+    # Unsorted tenors; terms below and above the curve grid; zero and NaN 1Y PDs
+    tenors = [5.0, 0.25, 10.0, 1.0, 2.0]
+    rates = [0.037, 0.036, 0.042, 0.035, 0.0352]
+    el_in = pd.DataFrame(
+        {
+            "loan_id": ["ZERO_PD", "NAN_PD", "SHORT", "LONG", "STEEP"],
+            "probability_of_default_1y": [0.0, np.nan, 0.0015, 0.03, 0.001],
+            "probability_of_default_5y": [0.01, 0.02, 0.008, 0.12, 0.02],
+            "probability_of_default_maturity": [0.02, 0.05, 0.004, 0.2, 0.03],
+            "exposure_at_default": [100000.0, 200000.0, 50000.0, 300000.0, 150000.0],
+            "remaining_term_years": [3.0, 7.5, 0.1, 15.0, 0.25],
+            "curve_tenors": [tenors] * 5,
+            "curve_rates": [rates] * 5,
+        }
+    )
+
+    el_out = ExpectedLossModel().predict(None, el_in.copy())
+    for (_, row), (_, out) in zip(el_in.iterrows(), el_out.iterrows()):
+        rating, lgd, el_undisc, el_disc, rwa = _reference_expected_loss(row, tenors, rates)
+        assert out["implied_credit_rating"] == rating, (row["loan_id"], out["implied_credit_rating"], rating)
+        assert out["implied_lgd"] == lgd, (row["loan_id"], out["implied_lgd"], lgd)
+        assert np.allclose(
+            [out["el_undiscounted"], out["el_discounted"], out["rwa"]],
+            [el_undisc, el_disc, rwa],
+            rtol=1e-12,
+            atol=0.0,
+        ), (row["loan_id"], out.to_dict())
+    print("Expected loss edge cases match the row-wise reference")
+
+
 def run_smoke_test():
     curve_in = pd.DataFrame({"curve_date": ["2024-12-31"]})
     curve_out = CreditCurveModel().predict(None, curve_in)
@@ -79,4 +137,5 @@ def run_smoke_test():
 
 
 if __name__ == "__main__":
+    run_expected_loss_edge_cases()
     run_smoke_test()
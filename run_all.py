@@ -14,23 +14,59 @@ parameter descriptions, and error handling.
 
 import argparse
 import base64
-import html
+import hashlib
 import json
 import os
 import re
 import shutil
 import subprocess
 import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from html.parser import HTMLParser
 from typing import Any
 
-import requests
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Environment configuration
-DOMINO_URL = os.environ.get("DOMINO_URL", "https://se-demo.domino.tech:443")
+DOMINO_URL = os.environ.get("DOMINO_URL", "https://se-demo.domino.tech:443").rstrip("/")
 API_KEY = os.environ.get("DOMINO_USER_API_KEY", "")
 PROJECT_ID = os.environ.get("DOMINO_PROJECT_ID", "")
 PROJECT_NAME = os.environ.get("DOMINO_PROJECT_NAME", "")
+MLFLOW_TRACKING_URI = os.environ.get("MLFLOW_TRACKING_URI", "").rstrip("/")
+
+# Auth header sent with every Domino API and overview page request
+DOMINO_HEADERS = {"X-Domino-Api-Key": API_KEY}
+
+# Model overview pages are fetched concurrently, one request per model
+DISCOVERY_WORKERS = 16
+
+# Registered model versions are immutable, so their artifacts are kept between runs
+ARTIFACT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "domino_udf_artifacts")
+
+# Patterns used while scraping and classifying discovered endpoints
+CURL_URL_RE = re.compile(r'https?://[^\s\'"]+')
+CURL_AUTH_RE = re.compile(r'(?:-u|--user)\s+[\'"]?([^:]+):([^\s\'"]+)[\'"]?')
+CURL_DATA_SINGLE_RE = re.compile(r"-d\s+'([^']*)'")
+CURL_DATA_DOUBLE_RE = re.compile(r'-d\s+"([^"]*)"')
+APP_ENDPOINT_RE = re.compile(r'^/endpoints/([0-9a-f-]{36})/')
+GENAI_URL_RE = re.compile(r'/endpoints/[0-9a-f-]{36}/v\d+', re.I)
+CHAT_COMPLETIONS_SUFFIX_RE = re.compile(r'/chat/completions/?$')
+MODEL_ID_RE = re.compile(r'/models/([a-f0-9]+)/')
+PARAM_TOKEN_RE = re.compile(r"[A-Z]?[a-z]+|[0-9]+|[A-Z]+(?![a-z])")
+DATE_STRING_RE = re.compile(r"^\d{4}[-/]\d{2}[-/]\d{2}([ T].*)?$")
+ARRAY_TYPE_RES = (
+    re.compile(r"array\s*<\s*([^>]+)\s*>", flags=re.I),
+    re.compile(r"array\s*\(\s*([^)]+)\s*\)", flags=re.I),
+    re.compile(r"array\s*\[\s*([^\]]+)\s*\]", flags=re.I),
+)
+CLEAN_NAME_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9]*$')
+NAME_SEPARATOR_RE = re.compile(r'[^a-zA-Z0-9]+')
 
 # Agent definitions: each agent wraps a GenAI endpoint with a custom system prompt
 AGENTS = {
@@ -146,21 +182,82 @@ class AgentUDFConfig:
 # Endpoint Discovery Functions (from claude_create_curls.py)
 # =============================================================================
 
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session():
+    """Return the shared keep-alive session, importing requests on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            # Transient gateway errors on GETs are retried; the last response is returned as-is
+            retry = Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset({"GET"}),
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+    return _session
+
+
+def _http_get(url: str, **kwargs):
+    """GET a URL over the shared session so repeated Domino/MLflow calls reuse connections."""
+    return _get_session().get(url, **kwargs)
+
+
+def _loads(raw: bytes | str) -> Any:
+    """Parse JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity or big integers, which only the stdlib parser accepts
+    return json.loads(raw)
+
+
+def _response_json(resp) -> Any:
+    """Parse a JSON response body from its raw bytes, skipping requests' text decoding."""
+    return _loads(resp.content)
+
+
 def get_models(project_id: str) -> list:
     """Get all models for a project."""
     url = f"{DOMINO_URL}/v4/modelManager/getModels"
-    headers = {"X-Domino-Api-Key": API_KEY}
-    resp = requests.get(url, params={"projectId": project_id}, headers=headers, timeout=30)
+    resp = _http_get(url, params={"projectId": project_id}, headers=DOMINO_HEADERS, timeout=30)
     resp.raise_for_status()
-    return resp.json()
+    return _response_json(resp)
 
 
-def discover_genai_endpoints(project_id: str, project_name: str) -> list[GenAIEndpointConfig]:
+def get_model_products(project_id: str) -> list:
+    """Get all app model products for a project."""
+    url = f"{DOMINO_URL}/v4/modelProducts"
+    resp = _http_get(url, params={"projectId": project_id}, headers=DOMINO_HEADERS, timeout=30)
+    resp.raise_for_status()
+    return _response_json(resp)
+
+
+def discover_genai_endpoints(
+    project_id: str,
+    project_name: str,
+    products_future: Future | None = None,
+) -> list[GenAIEndpointConfig]:
     """
     Discover gen-AI (OpenAI-compatible) endpoints from Domino App Endpoints.
 
     Queries /v4/modelProducts for running apps whose openUrl matches
     the /endpoints/{uuid}/ pattern, then builds GenAIEndpointConfig objects.
+    If products_future is given, its result is used instead of a new request.
     """
     genai_endpoints = []
 
@@ -169,12 +266,11 @@ def discover_genai_endpoints(project_id: str, project_name: str) -> list[GenAIEn
     parsed = urlparse(DOMINO_URL)
     apps_base = f"{parsed.scheme}://apps.{parsed.hostname}"
 
-    url = f"{DOMINO_URL}/v4/modelProducts"
-    headers = {"X-Domino-Api-Key": API_KEY}
     try:
-        resp = requests.get(url, params={"projectId": project_id}, headers=headers, timeout=30)
-        resp.raise_for_status()
-        products = resp.json()
+        if products_future is not None:
+            products = products_future.result()
+        else:
+            products = get_model_products(project_id)
     except Exception as e:
         print(f"  (could not query app endpoints: {e})")
         return []
@@ -187,7 +283,7 @@ def discover_genai_endpoints(project_id: str, project_name: str) -> list[GenAIEn
         # Only running apps with /endpoints/{uuid}/ URL pattern
         if status != "Running":
             continue
-        match = re.match(r'^/endpoints/([0-9a-f-]{36})/', open_url)
+        match = APP_ENDPOINT_RE.match(open_url)
         if not match:
             continue
 
@@ -212,8 +308,8 @@ def _load_input_example(local_dir: str) -> dict | None:
     for fname in ("serving_input_example.json", "input_example.json"):
         path = os.path.join(local_dir, fname)
         if os.path.exists(path):
-            with open(path) as f:
-                example = json.load(f)
+            with open(path, "rb") as f:
+                example = _loads(f.read())
             # Convert dataframe_split format to simple dict
             if "dataframe_split" in example:
                 cols = example["dataframe_split"]["columns"]
@@ -257,7 +353,7 @@ def _load_signature_inputs(local_dir: str) -> list[dict[str, Any]] | None:
 
     if isinstance(inputs, str):
         try:
-            inputs = json.loads(inputs)
+            inputs = _loads(inputs)
         except json.JSONDecodeError:
             return None
 
@@ -270,27 +366,45 @@ def _load_signature_inputs(local_dir: str) -> list[dict[str, Any]] | None:
     return inputs
 
 
+def _download_model_artifacts(source: str) -> str:
+    """Download a model version's artifacts, reusing the copy from an earlier run if present."""
+    from mlflow import artifacts
+
+    cache_dir = os.path.join(ARTIFACT_CACHE_DIR, hashlib.sha256(source.encode()).hexdigest()[:32])
+    marker = os.path.join(cache_dir, ".local_path")
+    if os.path.exists(marker):
+        with open(marker) as f:
+            local_dir = f.read()
+        if os.path.isdir(local_dir):
+            return local_dir
+
+    os.makedirs(cache_dir, exist_ok=True)
+    local_dir = artifacts.download_artifacts(artifact_uri=source, dst_path=cache_dir)
+    # Written last so an interrupted download is never mistaken for a complete one
+    with open(marker, "w") as f:
+        f.write(local_dir)
+    return local_dir
+
+
 def get_model_signature(model_name: str, model_version: int) -> dict | None:
     """Get the signature and input example for a registered model version from MLflow."""
-    tracking_uri = os.environ.get("MLFLOW_TRACKING_URI", "")
-    if not tracking_uri:
+    if not MLFLOW_TRACKING_URI:
         return None
 
     # Get the model version info to find the artifact source
-    url = f"{tracking_uri.rstrip('/')}/api/2.0/mlflow/model-versions/get"
-    resp = requests.get(url, params={"name": model_name, "version": model_version}, timeout=15)
+    url = f"{MLFLOW_TRACKING_URI}/api/2.0/mlflow/model-versions/get"
+    resp = _http_get(url, params={"name": model_name, "version": model_version}, timeout=15)
     if resp.status_code != 200:
         return None
 
-    source = resp.json().get("model_version", {}).get("source")
+    source = _response_json(resp).get("model_version", {}).get("source")
     if not source:
         return None
 
     # Download the model artifacts and parse signature + input example
     try:
-        from mlflow import artifacts
         os.environ.setdefault("MLFLOW_ENABLE_ARTIFACTS_PROGRESS_BAR", "false")
-        local_dir = artifacts.download_artifacts(artifact_uri=source)
+        local_dir = _download_model_artifacts(source)
 
         signature_inputs = _load_signature_inputs(local_dir)
         example = _load_input_example(local_dir)
@@ -302,24 +416,52 @@ def get_model_signature(model_name: str, model_version: int) -> dict | None:
     return None
 
 
+class _CurlTabParser(HTMLParser):
+    """Collect the text of the first <pre> inside the curl tab of a model overview page."""
+
+    def __init__(self):
+        super().__init__()
+        self.done = False
+        self._in_tab = False
+        self._in_pre = False
+        self._parts: list[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "div" and dict(attrs).get("id") == "language-curl":
+            self._in_tab = True
+        elif tag == "pre" and self._in_tab and not self.done:
+            self._in_pre = True
+
+    def handle_endtag(self, tag):
+        if tag == "pre" and self._in_pre:
+            self._in_pre = False
+            self.done = True
+
+    def handle_data(self, data):
+        if self._in_pre:
+            self._parts.append(data)
+
+    @property
+    def curl(self) -> str | None:
+        return "".join(self._parts).strip() if self.done else None
+
+
 def get_curl_from_html(model_id: str) -> str | None:
     """Fetch the model overview page and extract the curl command."""
     url = f"{DOMINO_URL}/models/{model_id}/overview"
-    headers = {"X-Domino-Api-Key": API_KEY}
-    resp = requests.get(url, headers=headers, timeout=15)
-    if resp.status_code != 200:
-        return None
+    with _http_get(url, headers=DOMINO_HEADERS, timeout=15, stream=True) as resp:
+        if resp.status_code != 200:
+            return None
+        resp.encoding = resp.encoding or "utf-8"
 
-    # Extract curl from the HTML
-    match = re.search(
-        r'<div role="tabpanel" class="tab-pane" id="language-curl">.*?<pre[^>]*>(.*?)</pre>',
-        resp.text,
-        flags=re.S | re.I,
-    )
-    if not match:
-        return None
+        # Parse the page as it arrives and stop parsing once the curl <pre> closes. The
+        # rest is still read to EOF so the keep-alive connection goes back to the pool.
+        parser = _CurlTabParser()
+        for chunk in resp.iter_content(chunk_size=16384, decode_unicode=True):
+            if not parser.done:
+                parser.feed(chunk)
 
-    return html.unescape(match.group(1)).strip()
+    return parser.curl
 
 
 def parse_curl_command(curl_text: str) -> dict | None:
@@ -335,25 +477,25 @@ def parse_curl_command(curl_text: str) -> dict | None:
 
     # Extract URL - look for the URL in the curl command
     # Usually follows 'curl' and comes before or after flags
-    url_match = re.search(r'https?://[^\s\'"]+', curl_text)
+    url_match = CURL_URL_RE.search(curl_text)
     if url_match:
         result['url'] = url_match.group(0)
 
     # Extract basic auth credentials (-u or --user flag)
     # Format: -u username:password or --user username:password
-    auth_match = re.search(r'(?:-u|--user)\s+[\'"]?([^:]+):([^\s\'"]+)[\'"]?', curl_text)
+    auth_match = CURL_AUTH_RE.search(curl_text)
     if auth_match:
         result['username'] = auth_match.group(1)
         result['password'] = auth_match.group(2)
 
     # Extract the data payload (-d flag)
     # Could be -d 'JSON' or -d "JSON"
-    data_match = re.search(r"-d\s+'([^']*)'", curl_text)
+    data_match = CURL_DATA_SINGLE_RE.search(curl_text)
     if not data_match:
-        data_match = re.search(r'-d\s+"([^"]*)"', curl_text)
+        data_match = CURL_DATA_DOUBLE_RE.search(curl_text)
     if data_match:
         try:
-            result['data'] = json.loads(data_match.group(1))
+            result['data'] = _loads(data_match.group(1))
         except json.JSONDecodeError:
             result['data'] = None
 
@@ -369,7 +511,7 @@ def extract_help_topic_url(endpoint_url: str, domino_base_url: str) -> str:
              → https://se-demo.domino.tech/models/696a8cffde2f14747436d217/overview?ownerName=nick_goble&projectName=EndpointUDFs
     """
     # Extract model_id from endpoint URL (handles /api/ or /latest/model patterns)
-    match = re.search(r'/models/([a-f0-9]+)/', endpoint_url)
+    match = MODEL_ID_RE.search(endpoint_url)
     if not match:
         return ""
 
@@ -384,21 +526,21 @@ def extract_help_topic_url(endpoint_url: str, domino_base_url: str) -> str:
 
 def _is_genai_url(url: str) -> bool:
     """Detect if a URL is a gen-AI endpoint (OpenAI-compatible /endpoints/{uuid}/v1 pattern)."""
-    return bool(re.search(r'/endpoints/[0-9a-f-]{36}/v\d+', url, re.I))
+    return bool(GENAI_URL_RE.search(url))
 
 
 def _genai_base_url(url: str) -> str:
     """Extract the base URL for a gen-AI endpoint (strip /chat/completions if present)."""
-    return re.sub(r'/chat/completions/?$', '', url).rstrip('/')
+    return CHAT_COMPLETIONS_SUFFIX_RE.sub('', url).rstrip('/')
 
 
 def _split_param_tokens(name: str) -> list[str]:
     """Split a parameter name into lowercase tokens for heuristics."""
     if not name:
         return []
-    tokens = re.findall(r"[A-Z]?[a-z]+|[0-9]+|[A-Z]+(?![a-z])", name)
+    tokens = PARAM_TOKEN_RE.findall(name)
     if not tokens:
-        tokens = re.split(r"[^a-zA-Z0-9]+", name)
+        tokens = NAME_SEPARATOR_RE.split(name)
     return [t.lower() for t in tokens if t]
 
 
@@ -406,13 +548,16 @@ def _looks_like_date_string(value: str) -> bool:
     """Detect common date formats like yyyy-mm-dd or ISO timestamps."""
     if not value:
         return False
-    return bool(re.match(r"^\d{4}[-/]\d{2}[-/]\d{2}([ T].*)?$", value.strip()))
+    return bool(DATE_STRING_RE.match(value.strip()))
+
+
+DATE_NAME_TOKENS = frozenset({"date", "dt", "dob"})
 
 
 def _is_date_param(name: str, value: Any) -> bool:
     """Heuristic detection for date-like parameters."""
     tokens = _split_param_tokens(name)
-    if any(t in {"date", "dt", "dob"} for t in tokens):
+    if not DATE_NAME_TOKENS.isdisjoint(tokens):
         return True
     if isinstance(value, str) and _looks_like_date_string(value):
         return True
@@ -455,14 +600,11 @@ def _parse_mlflow_input_type(spec: dict[str, Any]) -> tuple[str, bool]:
             item_type = str(items)
         return _map_mlflow_type(item_type, spec.get("name", ""), None), True
 
-    array_match = re.match(r"array\s*<\s*([^>]+)\s*>", type_name, flags=re.I)
-    if not array_match:
-        array_match = re.match(r"array\s*\(\s*([^)]+)\s*\)", type_name, flags=re.I)
-    if not array_match:
-        array_match = re.match(r"array\s*\[\s*([^\]]+)\s*\]", type_name, flags=re.I)
-    if array_match:
-        base_type = array_match.group(1)
-        return _map_mlflow_type(base_type, spec.get("name", ""), None), True
+    for array_re in ARRAY_TYPE_RES:
+        array_match = array_re.match(type_name)
+        if array_match:
+            base_type = array_match.group(1)
+            return _map_mlflow_type(base_type, spec.get("name", ""), None), True
 
     return _map_mlflow_type(type_name, spec.get("name", ""), None), False
 
@@ -502,6 +644,7 @@ def _infer_array_element_type(value: Any) -> str:
     return "object"
 
 
+@lru_cache(maxsize=None)
 def clean_function_name(name: str, prefix: str = "Model") -> str:
     """
     Clean a model name for use as a function name.
@@ -514,11 +657,11 @@ def clean_function_name(name: str, prefix: str = "Model") -> str:
         'SimpleModel' -> 'SimpleModel' (unchanged)
     """
     # If the name is already clean (only alphanumeric), return as-is
-    if re.match(r'^[a-zA-Z][a-zA-Z0-9]*$', name):
+    if CLEAN_NAME_RE.match(name):
         return name
 
     # Otherwise, split on non-alphanumeric and CamelCase it
-    parts = re.split(r'[^a-zA-Z0-9]+', name)
+    parts = NAME_SEPARATOR_RE.split(name)
     camel = ''.join(part.capitalize() for part in parts if part)
 
     # Ensure it starts with a letter
@@ -533,11 +676,10 @@ def get_project_name(project_id: str) -> str:
         return clean_function_name(PROJECT_NAME, prefix="Project")
 
     url = f"{DOMINO_URL}/v4/projects/{project_id}"
-    headers = {"X-Domino-Api-Key": API_KEY}
     try:
-        resp = requests.get(url, headers=headers, timeout=15)
+        resp = _http_get(url, headers=DOMINO_HEADERS, timeout=15)
         resp.raise_for_status()
-        name = resp.json().get("name", "")
+        name = _response_json(resp).get("name", "")
         if name:
             return clean_function_name(name, prefix="Project")
     except Exception:
@@ -546,35 +688,62 @@ def get_project_name(project_id: str) -> str:
     return ""
 
 
-def discover_endpoints(project_id: str, project_name: str) -> tuple[list[EndpointConfig], list[GenAIEndpointConfig]]:
+def _registered_version(model: dict) -> tuple[str, int] | None:
+    """Return the (registered model name, version) behind a model's active version, if any."""
+    active = model.get("activeVersion")
+    if not active:
+        return None
+    registered_name = active.get("registeredModelName")
+    registered_version = active.get("registeredModelVersion")
+    if registered_name and registered_version:
+        return registered_name, registered_version
+    return None
+
+
+def discover_endpoints(
+    project_id: str,
+    project_name: str,
+    models: list | None = None,
+) -> tuple[list[EndpointConfig], list[GenAIEndpointConfig]]:
     """
     Discover all model endpoints in a project and build EndpointConfig objects.
     Returns (regular_endpoints, genai_endpoints).
     """
     endpoints = []
     genai_endpoints = []
-    models = get_models(project_id)
-
-    for model in models:
-        model_id = model.get("id")
+    if models is None:
+        models = get_models(project_id)
+    models = [model for model in models if model.get("id")]
+
+    # Network fetches run concurrently; results are consumed in model order
+    with ThreadPoolExecutor(max_workers=DISCOVERY_WORKERS) as executor:
+        curl_texts = list(executor.map(get_curl_from_html, [model["id"] for model in models]))
+        curl_infos = [parse_curl_command(text) if text else None for text in curl_texts]
+
+        # Only model endpoints with credentials need a signature, and several model APIs
+        # can serve the same registered version, so each version is looked up once
+        signature_keys = list(dict.fromkeys(
+            key
+            for model, info in zip(models, curl_infos)
+            if info and 'username' in info and 'password' in info
+            and not _is_genai_url(info.get('url', ''))
+            and (key := _registered_version(model))
+        ))
+        signatures = dict(zip(signature_keys, executor.map(
+            get_model_signature,
+            [name for name, _ in signature_keys],
+            [version for _, version in signature_keys],
+        )))
+
+    for model, curl_text, curl_info in zip(models, curl_texts, curl_infos):
         name = model.get("name", "UnnamedModel")
-        active = model.get("activeVersion") or {}
-        registered_name = active.get("registeredModelName")
-        registered_version = active.get("registeredModelVersion")
-
-        if not model_id:
-            continue
 
         print(f"  Discovering: {name}...")
 
-        # Get the curl from the overview page
-        curl_text = get_curl_from_html(model_id)
         if not curl_text:
             print(f"    (skipped - no curl found)")
             continue
 
-        # Parse the curl command
-        curl_info = parse_curl_command(curl_text)
         if not curl_info:
             print(f"    (skipped - could not parse curl)")
             continue
@@ -598,9 +767,7 @@ def discover_endpoints(project_id: str, project_name: str) -> tuple[list[Endpoin
             continue
 
         # Try to get the signature from MLflow
-        signature = None
-        if registered_name and registered_version:
-            signature = get_model_signature(registered_name, registered_version)
+        signature = signatures.get(_registered_version(model))
 
         signature_inputs = None
         example_data = None
@@ -2029,17 +2196,24 @@ def main():
     print(f"Project ID: {project_id}")
     print()
 
-    project_name = get_project_name(project_id)
-
-    # Step 1: Discover endpoints
-    print("Step 1: Discovering model endpoints...")
-    print("-" * 40)
-    endpoints, genai_from_models = discover_endpoints(project_id, project_name)
+    # The project, model and app listings are independent, so fetch them together
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        project_name_future = executor.submit(get_project_name, project_id)
+        models_future = executor.submit(get_models, project_id)
+        products_future = executor.submit(get_model_products, project_id)
+        project_name = project_name_future.result()
+
+        # Step 1: Discover endpoints
+        print("Step 1: Discovering model endpoints...")
+        print("-" * 40)
+        endpoints, genai_from_models = discover_endpoints(
+            project_id, project_name, models_future.result()
+        )
 
-    print()
-    print("Step 1b: Discovering GenAI app endpoints...")
-    print("-" * 40)
-    genai_from_apps = discover_genai_endpoints(project_id, project_name)
+        print()
+        print("Step 1b: Discovering GenAI app endpoints...")
+        print("-" * 40)
+        genai_from_apps = discover_genai_endpoints(project_id, project_name, products_future)
 
     # Merge gen-AI endpoints from both sources (model discovery + app discovery)
     genai_endpoints = genai_from_models + genai_from_apps